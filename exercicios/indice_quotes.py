@@ -0,0 +1,108 @@
+from collections import Counter, defaultdict
+from urllib.parse import urljoin
+
+class IndiceQuotes:
+    """Armazena as citações com índices por autor e por tag.
+
+    As citações são extraídas uma única vez; depois disso as consultas
+    respondem em O(resultado), sem percorrer o soup ou o corpus de novo.
+    """
+
+    def __init__(self):
+        self.citacoes = []                 # id -> {'texto', 'autor', 'tags', 'tamanho'}
+        self.por_autor = defaultdict(list) # autor -> [ids]
+        self.por_tag = defaultdict(list)   # tag -> [ids]
+        self.contagem_tags = Counter()
+        self.id_mais_longa = None
+        self.autores_ordenados = None      # cache invalidado a cada inserção de autor novo
+
+    def adicionar(self, texto, autor, tags):
+        """Indexa uma citação e retorna o seu id"""
+        id_citacao = len(self.citacoes)
+        self.citacoes.append({'texto': texto, 'autor': autor, 'tags': tags, 'tamanho': len(texto)})
+
+        if autor not in self.por_autor:
+            self.autores_ordenados = None
+        self.por_autor[autor].append(id_citacao)
+        for tag in tags:
+            self.por_tag[tag].append(id_citacao)
+        self.contagem_tags.update(tags)
+
+        if self.id_mais_longa is None or len(texto) > self.citacoes[self.id_mais_longa]['tamanho']:
+            self.id_mais_longa = id_citacao
+        return id_citacao
+
+    def adicionar_do_soup(self, soup):
+        """Extrai todas as citações de uma página (uma passada) e indexa"""
+        total = 0
+        for quote in soup.find_all('div', class_='quote'):
+            texto = quote.find('span', class_='text').text.strip()
+            autor = quote.find('small', class_='author').text.strip()
+            tags = [tag.text.strip() for tag in quote.find_all('a', class_='tag')]
+            self.adicionar(texto, autor, tags)
+            total += 1
+        return total
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.citacoes)
+
+    def citacoes_do_autor(self, autor):
+        """Textos das citações de um autor"""
+        return [self.citacoes[i]['texto'] for i in self.por_autor.get(autor, [])]
+
+    def citacoes_com_tag(self, tag):
+        """Textos das citações marcadas com uma tag"""
+        return [self.citacoes[i]['texto'] for i in self.por_tag.get(tag, [])]
+
+    def top_tags(self, n=5):
+        """As N tags mais usadas: [(tag, quantidade), ...]"""
+        return self.contagem_tags.most_common(n)
+
+    def autores_unicos(self):
+        """Autores em ordem alfabética (ordenação feita só quando muda)"""
+        if self.autores_ordenados is None:
+            self.autores_ordenados = sorted(self.por_autor)
+        return self.autores_ordenados
+
+    def mais_longa(self):
+        """Texto da citação mais longa"""
+        if self.id_mais_longa is None:
+            return None
+        return self.citacoes[self.id_mais_longa]['texto']
+
+
+def rastrear_site(url="http://quotes.toscrape.com/", max_paginas=None, parser="lxml"):
+    """
+    Percorre as páginas seguindo o botão "Next" e indexa todas as citações
+
+    Args:
+        url (str): Página inicial
+        max_paginas (int): Limite de páginas (None = todas)
+        parser (str): Parser do BeautifulSoup
+
+    Returns:
+        IndiceQuotes: Índice com as citações de todas as páginas visitadas
+    """
+    import requests
+    from bs4 import BeautifulSoup
+
+    indice = IndiceQuotes()
+    sessao = requests.Session()
+    paginas = 0
+
+    while url and (max_paginas is None or paginas < max_paginas):
+        resposta = sessao.get(url, timeout=10)
+        resposta.raise_for_status()
+        soup = BeautifulSoup(resposta.text, parser)
+
+        indice.adicionar_do_soup(soup)
+        paginas += 1
+
+        proxima = soup.select_one('li.next a')
+        url = urljoin(url, proxima['href']) if proxima else None
+
+    return indice
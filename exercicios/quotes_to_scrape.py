@@ -20,22 +20,25 @@ print(f"Autor da citação: {soup.find_all('small', class_='author')[0].text.str
 # Exercicio 4
 print(f"Tags da citação: {[tag.text.strip() for tag in soup.find('div', class_='tags').find_all('a', class_='tag')]}\n")
 
+# Índice das citações: extraídas uma vez, consultadas sem varrer o soup de novo
+from indice_quotes import IndiceQuotes
+indice = IndiceQuotes()
+indice.adicionar_do_soup(soup)
+
 # Exercicio 5
-print(f"Total de quotes: {len(soup.find_all('div', class_='quote'))}\n")
+print(f"Total de quotes: {len(indice)}\n")
 
 # Exercicio 6
-print(f"Autores unicos: {sorted(set(author.text.strip() for author in soup.find_all('small', class_='author')))}\n")
+print(f"Autores unicos: {indice.autores_unicos()}\n")
 
 # Exercicio 7
-print(f"Quote Mais Longa: {max(soup.find_all('span', class_='text'), key=len).text.strip()}\n")
+print(f"Quote Mais Longa: {indice.mais_longa()}\n")
 
 # Exercicio 8
-print(f"Citações do autor 'Albert Einstein': {[quote.find('span', class_='text').text.strip() for quote in soup.find_all('div', class_='quote') if quote.find('small', class_='author').text.strip() == 'Albert Einstein']}\n")
+print(f"Citações do autor 'Albert Einstein': {indice.citacoes_do_autor('Albert Einstein')}\n")
 
 # Exercicio 9
-from collections import Counter
-tags = [tag.text.strip() for tag in soup.find_all('a', class_='tag')]
-print(f"Top 5 Tags: {Counter(tags).most_common(5)}\n")
+print(f"Top 5 Tags: {indice.top_tags(5)}\n")
 
 # Exercicio 10
 print(f"Links de navegação: {[link['href'] for link in soup.find('div', class_='row header-box').find_all('a')]}\n")
\ No newline at end of file
@@ -0,0 +1,175 @@
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+
+FORMATO_HORA = "%Y-%m-%d %H"
+
+class AgregadorIncremental:
+    """Mantém estatísticas das notícias atualizadas a cada item ingerido.
+
+    Em vez de recontar todo o histórico a cada relatório, o agregador guarda
+    contadores por categoria e por hora de publicação e só processa os itens
+    novos (identificados pelo GUID). O estado é persistido em JSON entre as
+    execuções de `monitorar_noticias`.
+    """
+
+    def __init__(self, arquivo_estado="agregados_g1.json", retencao_dias=30):
+        self.arquivo_estado = arquivo_estado
+        self.retencao_dias = retencao_dias
+        self.total = 0
+        self.categorias = Counter()
+        # "YYYY-MM-DD HH" -> Counter({categoria: quantidade})
+        self.buckets_hora = {}
+        # "YYYY-MM-DD" -> quantidade (não expira, é pequeno)
+        self.por_dia = Counter()
+        # guid -> hora em que foi ingerido, para expirar após a retenção
+        self.guids = {}
+        self.carregar()
+
+    def carregar(self):
+        """Carrega o estado salvo anteriormente, se existir"""
+        if not os.path.exists(self.arquivo_estado):
+            return
+
+        try:
+            with open(self.arquivo_estado, 'r', encoding='utf-8') as arquivo:
+                estado = json.load(arquivo)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar agregados ({e}); iniciando do zero.")
+            return
+
+        self.total = estado.get('total', 0)
+        self.categorias = Counter(estado.get('categorias', {}))
+        self.buckets_hora = {
+            hora: Counter(contagem) for hora, contagem in estado.get('buckets_hora', {}).items()
+        }
+        self.por_dia = Counter(estado.get('por_dia', {}))
+        self.guids = estado.get('guids', {})
+
+    def salvar(self):
+        """Persiste o estado de forma atômica (grava em temporário e renomeia)"""
+        estado = {
+            'total': self.total,
+            'categorias': self.categorias,
+            'buckets_hora': self.buckets_hora,
+            'por_dia': self.por_dia,
+            'guids': self.guids,
+            'atualizado_em': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        temporario = self.arquivo_estado + ".tmp"
+        try:
+            with open(temporario, 'w', encoding='utf-8') as arquivo:
+                json.dump(estado, arquivo, ensure_ascii=False)
+            os.replace(temporario, self.arquivo_estado)
+        except Exception as e:
+            print(f"Erro ao salvar agregados: {e}")
+
+    def obter_data_publicacao(self, noticia):
+        """Converte o pubDate do RSS em datetime local (sem fuso)"""
+        try:
+            data = parsedate_to_datetime(noticia['data_publicacao'])
+            if data.tzinfo is not None:
+                data = data.astimezone().replace(tzinfo=None)
+            return data
+        except (KeyError, TypeError, ValueError):
+            return datetime.now()
+
+    def ingerir(self, noticias):
+        """
+        Atualiza os contadores apenas com as notícias ainda não vistas
+
+        Args:
+            noticias (list): Lista de dicionários de notícias
+
+        Returns:
+            int: Quantidade de notícias novas contabilizadas
+        """
+        novas = 0
+        agora = datetime.now().strftime(FORMATO_HORA)
+        for noticia in noticias:
+            guid = noticia.get('guid', "N/A")
+            chave = guid if guid != "N/A" else noticia.get('link', "N/A")
+            if chave in self.guids:
+                continue
+
+            data = self.obter_data_publicacao(noticia)
+            hora = data.strftime(FORMATO_HORA)
+            categoria = noticia.get('categoria') or "N/A"
+
+            self.guids[chave] = agora
+            self.total += 1
+            self.categorias[categoria] += 1
+            self.buckets_hora.setdefault(hora, Counter())[categoria] += 1
+            self.por_dia[data.strftime("%Y-%m-%d")] += 1
+            novas += 1
+
+        self.descartar_antigos()
+        return novas
+
+    def descartar_antigos(self):
+        """Remove buckets horários e GUIDs fora do período de retenção"""
+        limite = (datetime.now() - timedelta(days=self.retencao_dias)).strftime(FORMATO_HORA)
+
+        for hora in [hora for hora in self.buckets_hora if hora < limite]:
+            del self.buckets_hora[hora]
+        self.guids = {guid: hora for guid, hora in self.guids.items() if hora >= limite}
+
+    def contagem_janela(self, horas=24):
+        """Contagem por categoria nas últimas `horas` horas"""
+        inicio = (datetime.now() - timedelta(hours=horas)).strftime(FORMATO_HORA)
+        contagem = Counter()
+        for hora, contagem_hora in self.buckets_hora.items():
+            if hora >= inicio:
+                contagem.update(contagem_hora)
+        return contagem
+
+    def top_categorias(self, n=3, horas=None):
+        """
+        Retorna as N categorias mais frequentes
+
+        Args:
+            n (int): Quantidade de categorias
+            horas (int): Janela deslizante em horas (None = todo o histórico)
+
+        Returns:
+            list: Lista de tuplas (categoria, quantidade)
+        """
+        contagem = self.categorias if horas is None else self.contagem_janela(horas)
+        return contagem.most_common(n)
+
+    def taxa_por_hora(self, horas=24):
+        """Publicações por hora nas últimas `horas` horas ({"YYYY-MM-DD HH": n})"""
+        inicio = (datetime.now() - timedelta(hours=horas)).strftime(FORMATO_HORA)
+        return {
+            hora: sum(contagem.values())
+            for hora, contagem in sorted(self.buckets_hora.items())
+            if hora >= inicio
+        }
+
+    def taxa_por_dia(self, dias=7):
+        """Publicações por dia nos últimos `dias` dias ({"YYYY-MM-DD": n})"""
+        inicio = (datetime.now() - timedelta(days=dias)).strftime("%Y-%m-%d")
+        return {dia: total for dia, total in sorted(self.por_dia.items()) if dia >= inicio}
+
+    def exibir_resumo(self, janela_horas=24, n=3):
+        """Exibe um resumo das estatísticas acumuladas"""
+        print(f"\n{'='*60}")
+        print("ESTATÍSTICAS ACUMULADAS")
+        print(f"{'='*60}")
+        print(f"Total de notícias: {self.total}")
+        print(f"Categorias distintas: {len(self.categorias)}")
+
+        print(f"\nTop {n} categorias (histórico):")
+        for i, (categoria, count) in enumerate(self.top_categorias(n), 1):
+            print(f"   {i}. {categoria}: {count} notícias")
+
+        print(f"\nTop {n} categorias (últimas {janela_horas}h):")
+        for i, (categoria, count) in enumerate(self.top_categorias(n, janela_horas), 1):
+            print(f"   {i}. {categoria}: {count} notícias")
+
+        taxa = self.taxa_por_hora(janela_horas)
+        if taxa:
+            print(f"\nMédia de publicações por hora (últimas {janela_horas}h): "
+                  f"{sum(taxa.values()) / janela_horas:.2f}")
@@ -0,0 +1,262 @@
+"""
+ANÁLISE VETORIZADA DO HISTÓRICO DE NOTÍCIAS
+Objetivo: Carregar o CSV/JSON gerado por `salvar_csv`/`salvar_json` com pandas
+e calcular as estatísticas com operações vetorizadas (sem loops em Python)
+"""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+# Tipos das colunas de texto; categoria vira `category` (códigos inteiros)
+TIPOS_COLUNAS = {
+    'titulo': 'string',
+    'link': 'string',
+    'descricao': 'string',
+    'categoria': 'category',
+    'data_publicacao': 'string',
+    'data_formatada': 'string',
+    'data_raspagem': 'string',
+    'extraido_em': 'string',
+    'guid': 'string',
+}
+
+FORMATO_PUBDATE = "%a, %d %b %Y %H:%M:%S %z"
+# O RFC 822 também aceita zonas por nome; o `%z` só entende deslocamentos numéricos
+ZONAS_RFC822 = {
+    'GMT': '+0000', 'UT': '+0000', 'UTC': '+0000', 'Z': '+0000',
+    'EST': '-0500', 'EDT': '-0400', 'CST': '-0600', 'CDT': '-0500',
+    'MST': '-0700', 'MDT': '-0600', 'PST': '-0800', 'PDT': '-0700',
+}
+PADRAO_ZONA_NOMEADA = r" (" + "|".join(ZONAS_RFC822) + r")$"
+FUSO_HORARIO = "America/Sao_Paulo"
+
+STOPWORDS = frozenset("""
+    a o as os de da do das dos e em no na nos nas um uma uns umas para por com
+    sem sobre que se ao aos à às é ser são foi mais menos como após até entre
+    diz contra pela pelo pelas pelos seu sua seus suas ele ela eles elas já não
+""".split())
+
+def carregar_historico(caminho):
+    """
+    Carrega o histórico de notícias com colunas tipadas
+
+    Args:
+        caminho (str): Arquivo .csv ou .json gerado pelo scraper
+
+    Returns:
+        DataFrame: Notícias com `categoria` categórica e `publicado_em` datetime
+    """
+    if caminho.endswith('.json'):
+        with open(caminho, 'r', encoding='utf-8') as arquivo:
+            df = pd.DataFrame.from_records(json.load(arquivo))
+        # Mesmo tratamento do na_values do CSV: "N/A" é ausência de valor
+        df = df.replace("N/A", pd.NA)
+        tipos = {coluna: tipo for coluna, tipo in TIPOS_COLUNAS.items() if coluna in df.columns}
+        df = df.astype(tipos)
+    else:
+        df = pd.read_csv(
+            caminho,
+            dtype=TIPOS_COLUNAS,
+            na_values=["N/A"],
+            keep_default_na=False,
+            encoding='utf-8',
+        )
+
+    if 'data_publicacao' in df.columns:
+        df['publicado_em'] = converter_pubdate(df['data_publicacao']).dt.tz_convert(FUSO_HORARIO)
+
+    return df
+
+def converter_pubdate(datas):
+    """
+    Converte datas RFC 822 (pubDate) para datetime UTC
+
+    O formato fixo mantém a conversão vetorizada; zonas por nome ("GMT",
+    "EST"...) viram deslocamentos antes, e só o que ainda falhar passa pelo
+    parser flexível.
+    """
+    datas = datas.str.replace(
+        PADRAO_ZONA_NOMEADA, lambda zona: " " + ZONAS_RFC822[zona.group(1)], regex=True
+    )
+    convertidas = pd.to_datetime(datas, format=FORMATO_PUBDATE, errors='coerce', utc=True)
+
+    restantes = convertidas.isna() & datas.notna()
+    if restantes.any():
+        convertidas[restantes] = pd.to_datetime(
+            datas[restantes], format='mixed', errors='coerce', utc=True
+        )
+    return convertidas
+
+def distribuicao_categorias(df):
+    """
+    Distribuição das notícias por categoria
+
+    Returns:
+        DataFrame: Colunas `quantidade` e `porcentagem`, ordenado por quantidade
+    """
+    contagem = df['categoria'].value_counts(dropna=False)
+    return pd.DataFrame({
+        'quantidade': contagem,
+        'porcentagem': (contagem / len(df) * 100).round(1),
+    })
+
+def heatmap_publicacoes(df):
+    """
+    Matriz dia da semana × hora com a quantidade de publicações
+
+    Returns:
+        DataFrame: Índice 0-6 (segunda a domingo), colunas 0-23
+    """
+    publicado = df['publicado_em'].dropna()
+    dia = publicado.dt.dayofweek.to_numpy()
+    hora = publicado.dt.hour.to_numpy()
+
+    # bincount sobre o índice linear evita o groupby para uma matriz fixa 7x24
+    contagem = np.bincount(dia * 24 + hora, minlength=7 * 24).reshape(7, 24)
+    return pd.DataFrame(contagem, index=range(7), columns=range(24))
+
+def estatisticas_titulos(df):
+    """
+    Estatísticas do tamanho dos títulos (em caracteres e palavras)
+
+    Returns:
+        DataFrame: Saída de `describe()` para as duas medidas
+    """
+    titulos = df['titulo'].fillna("")
+    return pd.DataFrame({
+        'caracteres': titulos.str.len(),
+        'palavras': titulos.str.count(r"\S+"),
+    }).describe()
+
+def extrair_termos(titulos):
+    """Tokeniza os títulos em uma Series de termos (um por linha, índice preservado)"""
+    termos = (
+        titulos.fillna("")
+        .str.lower()
+        .str.replace(r"[^\w\s]", " ", regex=True)
+        .str.split()
+        .explode()
+        .dropna()
+    )
+    return termos[(termos.str.len() > 3) & ~termos.isin(STOPWORDS)]
+
+def termos_em_alta(df, janela_horas=24, n=10, minimo=3):
+    """
+    Termos cuja frequência na janela recente mais cresceu em relação ao histórico
+
+    Args:
+        df (DataFrame): Histórico carregado por `carregar_historico`
+        janela_horas (int): Tamanho da janela recente
+        n (int): Quantidade de termos retornados
+        minimo (int): Ocorrências mínimas na janela recente
+
+    Returns:
+        DataFrame: Colunas `recente`, `historico` e `score`
+    """
+    publicado = df['publicado_em']
+    limite = publicado.max() - pd.Timedelta(hours=janela_horas)
+    recente = (publicado >= limite).to_numpy()
+
+    termos = extrair_termos(df['titulo'])
+    eh_recente = recente[df.index.get_indexer(termos.index)]
+
+    contagem_recente = termos[eh_recente].value_counts()
+    contagem_historico = termos[~eh_recente].value_counts()
+
+    tabela = pd.DataFrame({'recente': contagem_recente, 'historico': contagem_historico})
+    tabela = tabela.fillna(0).astype('int64')
+    tabela = tabela[tabela['recente'] >= minimo]
+
+    # Frequências relativas com suavização de Laplace
+    total_recente = max(int(recente.sum()), 1)
+    total_historico = max(int((~recente).sum()), 1)
+    tabela['score'] = (
+        (tabela['recente'] + 1) / total_recente
+    ) / (
+        (tabela['historico'] + 1) / total_historico
+    )
+    return tabela.sort_values('score', ascending=False).head(n)
+
+def gerar_historico_sintetico(n_linhas=1_000_000, semente=42):
+    """
+    Gera um histórico sintético com o mesmo esquema do CSV do scraper
+
+    Args:
+        n_linhas (int): Quantidade de notícias
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        DataFrame: Histórico pronto para as funções de análise
+    """
+    rng = np.random.default_rng(semente)
+    categorias = pd.Categorical.from_codes(
+        rng.integers(0, 12, n_linhas),
+        categories=[f"Categoria {i}" for i in range(12)],
+    )
+    vocabulario = np.array([
+        "governo", "eleição", "chuva", "economia", "polícia", "saúde", "escola",
+        "futebol", "inflação", "vacina", "trânsito", "incêndio", "congresso",
+        "ministro", "prefeitura", "operação", "tempestade", "mercado",
+    ])
+    palavras = vocabulario[rng.integers(0, len(vocabulario), (n_linhas, 4))]
+    titulos = pd.Series(
+        np.char.add(np.char.add(palavras[:, 0], " "), np.char.add(palavras[:, 1], " ")),
+        dtype='string',
+    ) + pd.Series(np.char.add(np.char.add(palavras[:, 2], " "), palavras[:, 3]), dtype='string')
+
+    inicio = pd.Timestamp("2025-01-01", tz=FUSO_HORARIO)
+    segundos = np.sort(rng.integers(0, 365 * 24 * 3600, n_linhas))
+
+    return pd.DataFrame({
+        'titulo': titulos,
+        'categoria': categorias,
+        'publicado_em': inicio + pd.to_timedelta(segundos, unit='s'),
+    })
+
+def executar_benchmark(n_linhas=1_000_000):
+    """Mede o tempo de cada análise sobre um histórico sintético"""
+    print(f"\n{'='*60}")
+    print(f"BENCHMARK DAS ANÁLISES ({n_linhas:,} linhas)")
+    print(f"{'='*60}")
+
+    inicio = time.perf_counter()
+    df = gerar_historico_sintetico(n_linhas)
+    print(f"Geração dos dados: {time.perf_counter() - inicio:.2f}s "
+          f"({df.memory_usage(deep=True).sum() / 1024**2:.1f} MB)")
+
+    analises = [
+        ("Distribuição por categoria", distribuicao_categorias),
+        ("Heatmap dia × hora", heatmap_publicacoes),
+        ("Tamanho dos títulos", estatisticas_titulos),
+        ("Termos em alta", termos_em_alta),
+    ]
+    for nome, funcao in analises:
+        inicio = time.perf_counter()
+        funcao(df)
+        print(f"{nome}: {time.perf_counter() - inicio:.3f}s")
+
+def main(caminho="noticias_g1_brasil.csv"):
+    """Executa todas as análises sobre o histórico coletado"""
+    df = carregar_historico(caminho)
+    print(f"Notícias carregadas: {len(df)}")
+
+    print("\nDISTRIBUIÇÃO POR CATEGORIA:")
+    print(distribuicao_categorias(df).to_string())
+
+    print("\nPUBLICAÇÕES POR DIA DA SEMANA × HORA:")
+    print(heatmap_publicacoes(df).to_string())
+
+    print("\nTAMANHO DOS TÍTULOS:")
+    print(estatisticas_titulos(df).round(1).to_string())
+
+    print("\nTERMOS EM ALTA (últimas 24h):")
+    print(termos_em_alta(df).to_string())
+
+if __name__ == "__main__":
+    main()
+
+    # Para medir o desempenho com 1 milhão de linhas, descomente a linha abaixo:
+    # executar_benchmark(1_000_000)
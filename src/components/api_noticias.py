@@ -0,0 +1,264 @@
+"""
+API LOCAL DE LEITURA DAS NOTÍCIAS
+Objetivo: Servir as notícias coletadas para os dashboards via HTTP, sem que
+cada requisição precise reler e reparsear os arquivos
+
+Endpoints:
+    GET /noticias?limite=20&categoria=Política   últimas notícias (filtro opcional)
+    GET /busca?q=termo&limite=20                 busca no título e na descrição
+    GET /categorias                              quantidade por categoria
+    GET /saude                                   estado do serviço
+
+A fonte é o JSON de `salvar_json` ou um SQLite com a tabela `noticias`
+(pipeline_g1.DestinoSQLite / fila_trabalho). As respostas ficam em cache na
+memória e são invalidadas quando a fonte muda (novo ciclo de ingestão).
+Todas as respostas têm ETag; `If-None-Match` devolve 304.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from urllib.request import pathname2url
+
+DATA_MINIMA = datetime.min.replace(tzinfo=timezone.utc)
+
+# Parâmetros que cada endpoint usa; os demais não entram na chave do cache
+PARAMETROS = {
+    '/noticias': ('categoria', 'limite'),
+    '/busca': ('q', 'limite'),
+}
+
+class FonteNoticias:
+    """Carrega as notícias da fonte e detecta quando ela foi atualizada"""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.eh_sqlite = caminho.endswith('.db') or caminho.endswith('.sqlite')
+        self.conexao = None
+        self.trava = threading.Lock()
+        self.versao_carregada = None
+        self.noticias = []
+        self.erro = None  # Motivo da fonte estar indisponível (a API responde 503)
+
+    def versao(self):
+        """Identificador barato da versão atual da fonte (None se indisponível)"""
+        try:
+            if self.eh_sqlite:
+                if self.conexao is None:
+                    # Somente leitura: um caminho errado falha em vez de criar um banco vazio
+                    self.conexao = sqlite3.connect(
+                        f"file:{pathname2url(os.path.abspath(self.caminho))}?mode=ro",
+                        uri=True, check_same_thread=False,
+                    )
+                # data_version muda quando outra conexão faz commit
+                with self.trava:
+                    versao_db = self.conexao.execute("PRAGMA data_version").fetchone()[0]
+                return (versao_db, os.stat(self.caminho).st_mtime_ns)
+            estado = os.stat(self.caminho)
+            return (estado.st_mtime_ns, estado.st_size)
+        except (OSError, sqlite3.Error) as e:
+            if self.conexao is not None:
+                self.conexao.close()
+                self.conexao = None
+            self.erro = f"Fonte indisponível ({self.caminho}): {e}"
+            return None
+
+    def atualizar(self):
+        """
+        Recarrega as notícias se a fonte mudou
+
+        Returns:
+            tuple: Versão atualmente carregada
+        """
+        versao = self.versao()
+        if versao is None:
+            with self.trava:
+                self.noticias = []
+                self.versao_carregada = None
+            return None
+        if versao == self.versao_carregada:
+            return versao
+
+        with self.trava:
+            if versao != self.versao_carregada:
+                self.noticias = self.carregar()
+                self.versao_carregada = versao
+        return versao
+
+    def carregar(self):
+        """Lê todas as notícias, ordenadas da mais recente para a mais antiga"""
+        self.erro = None
+        try:
+            if self.eh_sqlite:
+                self.conexao.row_factory = sqlite3.Row
+                noticias = [dict(linha) for linha in self.conexao.execute("SELECT * FROM noticias")]
+            else:
+                with open(self.caminho, 'r', encoding='utf-8') as arquivo:
+                    noticias = json.load(arquivo)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(f"Erro ao carregar {self.caminho}: {e}")
+            self.erro = f"Erro ao carregar {self.caminho}: {e}"
+            noticias = []
+
+        for noticia in noticias:
+            try:
+                data = parsedate_to_datetime(noticia.get('data_publicacao'))
+                if data.tzinfo is None:
+                    data = data.replace(tzinfo=timezone.utc)
+            except (TypeError, ValueError):
+                data = DATA_MINIMA
+            noticia['_ordem'] = data
+            noticia['_busca'] = f"{noticia.get('titulo') or ''} {noticia.get('descricao') or ''}".lower()
+
+        noticias.sort(key=lambda noticia: noticia['_ordem'], reverse=True)
+        return noticias
+
+def publicas(noticias):
+    """Remove os campos internos antes de serializar"""
+    return [{chave: valor for chave, valor in noticia.items() if not chave.startswith('_')}
+            for noticia in noticias]
+
+class ServicoNoticias:
+    """Consultas sobre a fonte, com cache LRU de respostas por versão"""
+
+    def __init__(self, fonte, limite_maximo=200, max_respostas_cache=512):
+        self.fonte = fonte
+        self.limite_maximo = limite_maximo
+        self.max_respostas_cache = max_respostas_cache
+        self.cache = OrderedDict()
+        self.versao_cache = None
+        self.trava = threading.Lock()
+
+    def responder(self, caminho, parametros):
+        """
+        Retorna (status, corpo em bytes, etag) para uma requisição
+
+        O corpo serializado é reaproveitado enquanto a fonte não mudar.
+        """
+        versao = self.fonte.atualizar()
+        if self.fonte.erro is not None:
+            corpo = json.dumps({'erro': self.fonte.erro}, ensure_ascii=False).encode('utf-8')
+            return 503, corpo, f'"{zlib.crc32(corpo):08x}-{len(corpo)}"'
+        # Só os parâmetros conhecidos (e só o primeiro valor, o que é usado)
+        parametros = {
+            nome: parametros[nome][:1]
+            for nome in PARAMETROS.get(caminho, ()) if nome in parametros
+        }
+        chave = (caminho, tuple(sorted((nome, valor[0]) for nome, valor in parametros.items())))
+
+        with self.trava:
+            if versao != self.versao_cache:
+                self.cache.clear()
+                self.versao_cache = versao
+            resposta = self.cache.get(chave)
+            if resposta is not None:
+                self.cache.move_to_end(chave)
+                return resposta
+
+        status, dados = self.consultar(caminho, parametros)
+        corpo = json.dumps(dados, ensure_ascii=False).encode('utf-8')
+        etag = f'"{zlib.crc32(corpo):08x}-{len(corpo)}"'
+        resposta = (status, corpo, etag)
+
+        if status == 200:
+            with self.trava:
+                if versao == self.versao_cache:
+                    self.cache[chave] = resposta
+                    while len(self.cache) > self.max_respostas_cache:
+                        self.cache.popitem(last=False)
+        return resposta
+
+    def limite(self, parametros, padrao=20):
+        try:
+            return max(1, min(int(parametros.get('limite', [padrao])[0]), self.limite_maximo))
+        except ValueError:
+            return padrao
+
+    def consultar(self, caminho, parametros):
+        """Executa a consulta (só chamada em falta de cache)"""
+        noticias = self.fonte.noticias
+
+        if caminho == '/noticias':
+            categoria = parametros.get('categoria', [None])[0]
+            if categoria:
+                noticias = [n for n in noticias if n.get('categoria') == categoria]
+            return 200, publicas(noticias[:self.limite(parametros)])
+
+        if caminho == '/busca':
+            termo = parametros.get('q', [''])[0].strip().lower()
+            if not termo:
+                return 400, {'erro': "Parâmetro 'q' obrigatório"}
+            limite = self.limite(parametros)
+            encontradas = []
+            for noticia in noticias:
+                if termo in noticia['_busca']:
+                    encontradas.append(noticia)
+                    if len(encontradas) >= limite:
+                        break
+            return 200, publicas(encontradas)
+
+        if caminho == '/categorias':
+            return 200, dict(Counter(n.get('categoria') for n in noticias).most_common())
+
+        if caminho == '/saude':
+            return 200, {'noticias': len(noticias), 'fonte': self.fonte.caminho}
+
+        return 404, {'erro': f"Endpoint não encontrado: {caminho}"}
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeçalho e corpo saem em escritas separadas; sem isso o Nagle + ACK
+    # atrasado somam ~40 ms a cada resposta em conexões keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        status, corpo, etag = self.server.servico.responder(url.path, parse_qs(url.query))
+
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(corpo)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, formato, *args):
+        if self.server.verboso:
+            super().log_message(formato, *args)
+
+def criar_servidor(fonte="noticias_g1_brasil.json", host="127.0.0.1", porta=8000, verboso=False):
+    """Cria o servidor HTTP (use serve_forever() para iniciar)"""
+    servidor = ThreadingHTTPServer((host, porta), ApiHandler)
+    servidor.daemon_threads = True
+    servidor.servico = ServicoNoticias(FonteNoticias(fonte))
+    servidor.verboso = verboso
+    return servidor
+
+def main(fonte="noticias_g1_brasil.json", porta=8000):
+    """Inicia a API local"""
+    servidor = criar_servidor(fonte, porta=porta, verboso=True)
+    print(f"API de notícias em http://127.0.0.1:{servidor.server_port}/noticias (fonte: {fonte})")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nAPI encerrada.")
+    finally:
+        servidor.server_close()
+
+if __name__ == "__main__":
+    main()
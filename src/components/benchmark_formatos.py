@@ -0,0 +1,74 @@
+"""
+BENCHMARK DA NORMALIZAÇÃO DE FEEDS
+Objetivo: Medir a detecção de formato e a normalização de feeds RSS 2.0,
+Atom e RDF sintéticos com o mesmo número de itens
+"""
+
+import time
+
+from pipeline_g1 import detectar_formato, normalizar_feed
+
+def gerar_rss(n):
+    itens = "".join(
+        f"<item><title>Notícia {i}</title><link>https://exemplo.com/{i}</link>"
+        f"<description>Descrição da notícia {i}</description>"
+        f"<pubDate>Wed, 08 Aug 2025 10:30:00 -0300</pubDate><category>Brasil</category>"
+        f"<guid>https://exemplo.com/{i}</guid>"
+        f"<media:content url=\"https://exemplo.com/{i}.jpg\" medium=\"image\"/></item>"
+        for i in range(n)
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+            f'<title>Feed</title>{itens}</channel></rss>')
+
+def gerar_atom(n):
+    entradas = "".join(
+        f"<entry><title>Notícia {i}</title><link rel=\"alternate\" href=\"https://exemplo.com/{i}\"/>"
+        f"<summary>Descrição da notícia {i}</summary><published>2025-08-08T10:30:00-03:00</published>"
+        f"<category term=\"Brasil\"/><id>urn:uuid:{i}</id></entry>"
+        for i in range(n)
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?>'
+            f'<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>{entradas}</feed>')
+
+def gerar_rdf(n):
+    itens = "".join(
+        f"<item rdf:about=\"https://exemplo.com/{i}\"><title>Notícia {i}</title>"
+        f"<link>https://exemplo.com/{i}</link><description>Descrição da notícia {i}</description>"
+        f"<dc:date>2025-08-08T10:30:00-03:00</dc:date><dc:subject>Brasil</dc:subject></item>"
+        for i in range(n)
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+            'xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            f'<channel><title>Feed</title></channel>{itens}</rdf:RDF>')
+
+def medir(documento, tamanho_pedaco=64 * 1024, repeticoes=5):
+    """Retorna (segundos na detecção, segundos na normalização, itens) — melhor de N"""
+    dados = documento.encode('utf-8')
+    pedacos = [dados[i:i + tamanho_pedaco] for i in range(0, len(dados), tamanho_pedaco)]
+
+    melhor_deteccao = melhor_normalizacao = float('inf')
+    itens = 0
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        detectar_formato(dados)
+        melhor_deteccao = min(melhor_deteccao, time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        itens = sum(1 for _ in normalizar_feed(pedacos))
+        melhor_normalizacao = min(melhor_normalizacao, time.perf_counter() - inicio)
+
+    return melhor_deteccao, melhor_normalizacao, itens
+
+def main(n_itens=20000):
+    print(f"{'Formato':<8} {'Tamanho (MB)':>13} {'Detecção (µs)':>15} {'Normalização (s)':>17} {'Itens/s':>12}")
+    print("-" * 70)
+    for nome, gerador in (("RSS", gerar_rss), ("Atom", gerar_atom), ("RDF", gerar_rdf)):
+        documento = gerador(n_itens)
+        deteccao, normalizacao, itens = medir(documento)
+        print(f"{nome:<8} {len(documento.encode('utf-8')) / 1024 ** 2:>13.1f} "
+              f"{deteccao * 1e6:>15.1f} {normalizacao:>17.3f} {itens / normalizacao:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
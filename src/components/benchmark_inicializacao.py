@@ -0,0 +1,53 @@
+"""
+BENCHMARK DE INICIALIZAÇÃO DA CLI
+Objetivo: Comparar o tempo de importação (python -X importtime) da CLI com
+imports adiados contra importar o scraper completo no início
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+CENARIOS = [
+    ("Scraper completo (import no topo)", ["-c", "import bs4_g1rss_monitoramento"]),
+    ("CLI --help", ["cli_g1.py", "--help"]),
+    ("CLI stats", ["cli_g1.py", "stats", "--arquivo", os.devnull]),
+]
+
+def tempo_importacao(argumentos):
+    """
+    Executa o Python com -X importtime e soma o tempo cumulativo dos módulos de topo
+
+    Returns:
+        tuple: (microssegundos de importação, segundos de relógio)
+    """
+    inicio = time.perf_counter()
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", *argumentos],
+        cwd=DIRETORIO, capture_output=True, text=True,
+    )
+    duracao = time.perf_counter() - inicio
+
+    total = 0
+    for linha in resultado.stderr.splitlines():
+        # Linhas de topo não têm indentação antes do nome do módulo
+        encontrado = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\S.*)$", linha)
+        if encontrado:
+            total += int(encontrado.group(1))
+    return total, duracao
+
+def main(repeticoes=5):
+    """Mostra a mediana de cada cenário"""
+    print(f"{'Cenário':<40} {'Imports (ms)':>14} {'Total (ms)':>12}")
+    print("-" * 68)
+    for nome, argumentos in CENARIOS:
+        medidas = sorted(tempo_importacao(argumentos) for _ in range(repeticoes))
+        importacao, duracao = medidas[len(medidas) // 2]
+        print(f"{nome:<40} {importacao / 1000:>14.1f} {duracao * 1000:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -4,18 +4,34 @@ from datetime import datetime
 import csv
 import json
 import time
+from collections import Counter
+from contextlib import nullcontext
+
+from agregados_incrementais import AgregadorIncremental
+from pipeline_g1 import CAMPOS, formatar_data, normalizar_feed
+from revisoes import RegistroRevisoes, NOVA, REVISADA, INALTERADA
 
 class G1RSScraper:
-    def __init__(self):
+    def __init__(self, cache=None, revisoes=None):
         self.url = "https://g1.globo.com/rss/g1/brasil/"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.noticias = []
+        # CacheHTTP opcional (cache em disco e gravação/reprodução de cassetes)
+        self.cache = cache
+        # RegistroRevisoes opcional: separa as notícias novas ou revisadas em
+        # `alteradas`; `noticias` continua com o feed completo (snapshot)
+        self.revisoes = revisoes
+        self.alteradas = []
+        self.contagem_revisoes = {}
     
     def fazer_requisicao(self):
         """Faz a requisição HTTP para o feed RSS"""
         try:
+            if self.cache is not None:
+                return self.cache.obter(self.url, headers=self.headers, timeout=10)
+            
             response = requests.get(self.url, headers=self.headers, timeout=10)
             response.raise_for_status()
             response.encoding = 'utf-8'
@@ -25,89 +41,53 @@ class G1RSScraper:
             return None
     
     def parsear_rss(self, xml_content):
-        """Faz o parsing do XML do RSS"""
+        """Faz o parsing do XML do feed (RSS 2.0, Atom ou RDF)"""
         try:
-            root = ET.fromstring(xml_content)
-            
-            # Encontra todos os itens (notícias) no RSS
-            items = root.findall('.//item')
-            
-            for item in items:
-                noticia = self.extrair_dados_noticia(item)
-                if noticia:
-                    self.noticias.append(noticia)
+            # O formato é detectado pelos primeiros bytes e cada item é
+            # convertido para o mesmo dicionário de notícia. A lista é local
+            # para que um XML quebrado no meio não deixe notícias parciais
+            noticias = list(normalizar_feed([xml_content]))
+            self.noticias.extend(noticias)
             
             print(f"Total de notícias encontradas: {len(self.noticias)}")
+            
+            if self.revisoes is not None:
+                self.separar_alteradas()
             return True
             
-        except ET.ParseError as e:
+        except (ET.ParseError, ValueError) as e:
             print(f"Erro ao fazer parsing do XML: {e}")
+            # O corpo ruim não pode continuar no cache, senão volta via 304
+            if self.cache is not None:
+                self.cache.invalidar(self.url)
             return False
     
-    def extrair_dados_noticia(self, item):
-        """Extrai os dados de cada notícia do XML"""
-        try:
-            noticia = {}
-            
-            # Título
-            titulo = item.find('title')
-            noticia['titulo'] = titulo.text if titulo is not None else "N/A"
-            
-            # Link
-            link = item.find('link')
-            noticia['link'] = link.text if link is not None else "N/A"
-            
-            # Descrição
-            description = item.find('description')
-            noticia['descricao'] = description.text if description is not None else "N/A"
-            
-            # Data de publicação
-            pub_date = item.find('pubDate')
-            if pub_date is not None:
-                noticia['data_publicacao'] = pub_date.text
-                noticia['data_formatada'] = self.formatar_data(pub_date.text)
-            else:
-                noticia['data_publicacao'] = "N/A"
-                noticia['data_formatada'] = "N/A"
-            
-            # Categoria
-            category = item.find('category')
-            noticia['categoria'] = category.text if category is not None else "N/A"
-            
-            # GUID (identificador único)
-            guid = item.find('guid')
-            noticia['guid'] = guid.text if guid is not None else "N/A"
-            
-            # Data e hora da raspagem
-            noticia['data_raspagem'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            return noticia
-            
-        except Exception as e:
-            print(f"Erro ao extrair dados da notícia: {e}")
-            return None
+    def separar_alteradas(self):
+        """Guarda em `alteradas` as notícias novas ou revisadas desde a última leitura"""
+        estados = self.revisoes.classificar(self.noticias)
+        self.contagem_revisoes = dict(Counter(estados))
+        self.alteradas = [
+            dict(noticia, revisao=estado)
+            for noticia, estado in zip(self.noticias, estados)
+            if estado != INALTERADA
+        ]
+        print(f"Novas: {self.contagem_revisoes.get(NOVA, 0)} | "
+              f"Revisadas: {self.contagem_revisoes.get(REVISADA, 0)} | "
+              f"Inalteradas: {self.contagem_revisoes.get(INALTERADA, 0)}")
     
     def formatar_data(self, data_rss):
         """Converte a data do RSS para formato mais legível"""
-        try:
-            # Formato típico do RSS: "Wed, 08 Aug 2025 10:30:00 -0300"
-            data_obj = datetime.strptime(data_rss[:25], "%a, %d %b %Y %H:%M:%S")
-            return data_obj.strftime("%d/%m/%Y %H:%M:%S")
-        except:
-            return data_rss
+        return formatar_data(data_rss)
     
     def salvar_csv(self, nome_arquivo="noticias_g1_brasil.csv"):
-        """Salva as notícias em arquivo CSV"""
+        """Salva as notícias em arquivo CSV (retorna False se a gravação falhar)"""
         if not self.noticias:
             print("Nenhuma notícia para salvar.")
-            return
+            return True
         
         try:
             with open(nome_arquivo, 'w', newline='', encoding='utf-8') as arquivo:
-                campos = ['titulo', 'link', 'descricao', 'categoria', 'data_publicacao', 
-                         'data_formatada', 'data_raspagem', 'guid']
-                
-                writer = csv.DictWriter(arquivo, fieldnames=campos)
+                writer = csv.DictWriter(arquivo, fieldnames=CAMPOS, extrasaction='ignore')
                 writer.writeheader()
                 
                 for noticia in self.noticias:
@@ -117,12 +97,14 @@ class G1RSScraper:
             
         except Exception as e:
             print(f"Erro ao salvar CSV: {e}")
+            return False
+        return True
     
     def salvar_json(self, nome_arquivo="noticias_g1_brasil.json"):
-        """Salva as notícias em arquivo JSON"""
+        """Salva as notícias em arquivo JSON (retorna False se a gravação falhar)"""
         if not self.noticias:
             print("Nenhuma notícia para salvar.")
-            return
+            return True
         
         try:
             with open(nome_arquivo, 'w', encoding='utf-8') as arquivo:
@@ -132,6 +114,25 @@ class G1RSScraper:
             
         except Exception as e:
             print(f"Erro ao salvar JSON: {e}")
+            return False
+        return True
+    
+    def salvar_alteracoes(self, nome_arquivo="alteracoes_g1.jsonl"):
+        """Acrescenta as notícias novas/revisadas do ciclo em um arquivo JSONL"""
+        if not self.alteradas:
+            return True
+        
+        try:
+            with open(nome_arquivo, 'a', encoding='utf-8') as arquivo:
+                for noticia in self.alteradas:
+                    arquivo.write(json.dumps(noticia, ensure_ascii=False) + "\n")
+            
+            print(f"Alterações salvas em: {nome_arquivo}")
+            
+        except Exception as e:
+            print(f"Erro ao salvar alterações: {e}")
+            return False
+        return True
     
     def exibir_noticias(self, limite=5):
         """Exibe as primeiras notícias na tela"""
@@ -174,13 +175,15 @@ class G1RSScraper:
         if salvar_arquivos:
             self.salvar_csv()
             self.salvar_json()
+            if self.revisoes is not None:
+                self.salvar_alteracoes()
         
         return True
 
 # Função para executar o scraper
-def main():
+def main(cache=None):
     """Função principal para executar o scraper"""
-    scraper = G1RSScraper()
+    scraper = G1RSScraper(cache=cache)
     
     try:
         sucesso = scraper.executar_raspagem(
@@ -201,20 +204,57 @@ def main():
         print(f"Erro inesperado: {e}")
 
 # Exemplo de uso com monitoramento contínuo
-def monitorar_noticias(intervalo_minutos=30):
-    """Monitora o feed RSS em intervalos regulares"""
+def monitorar_noticias(intervalo_minutos=30, arquivo_agregados="agregados_g1.json", cache=None,
+                       arquivo_revisoes=None, despachante=None, perfilador=None):
+    """
+    Monitora o feed RSS em intervalos regulares
+    
+    Os arquivos CSV/JSON sempre recebem o feed completo. Com
+    `arquivo_revisoes`, as notícias novas ou revisadas de cada ciclo também
+    são acrescentadas em `alteracoes_g1.jsonl`, e só elas seguem para o
+    despachante e os agregados.
+    Com `despachante` (DespachanteNotificacoes já iniciado), as notícias do
+    ciclo são enviadas aos consumidores sem bloquear o loop.
+    Com `perfilador` (PerfiladorCiclos), cada ciclo é perfilado e os limites
+    de memória são verificados antes de aguardar o próximo; se o perfilador
+    reiniciar o processo, o despachante é parado antes.
+    """
     print(f"Iniciando monitoramento a cada {intervalo_minutos} minutos...")
     
+    # Estatísticas mantidas de forma incremental entre ciclos e execuções
+    agregador = AgregadorIncremental(arquivo_agregados)
+    revisoes = RegistroRevisoes(arquivo_revisoes) if arquivo_revisoes else None
+    
+    def encerrar():
+        """Antes de um reinício pelo perfilador: entrega as notificações pendentes"""
+        if despachante is not None:
+            despachante.parar()
+        if revisoes is not None:
+            revisoes.fechar()
+    
     while True:
         try:
             print(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Verificando novas notícias...")
             
-            scraper = G1RSScraper()
-            scraper.executar_raspagem(
-                salvar_arquivos=True,
-                exibir=False,
-                limite_exibicao=0
-            )
+            with perfilador.ciclo() if perfilador is not None else nullcontext():
+                scraper = G1RSScraper(cache=cache, revisoes=revisoes)
+                scraper.executar_raspagem(
+                    salvar_arquivos=True,
+                    exibir=False,
+                    limite_exibicao=0
+                )
+            
+                noticias_ciclo = scraper.alteradas if revisoes is not None else scraper.noticias
+                if despachante is not None and noticias_ciclo:
+                    despachante.enviar(noticias_ciclo)
+            
+                novas = agregador.ingerir(noticias_ciclo)
+                agregador.salvar()
+                print(f"Notícias novas contabilizadas: {novas}")
+                agregador.exibir_resumo()
+            
+            if perfilador is not None:
+                perfilador.verificar_memoria(ao_reiniciar=encerrar)
             
             print(f"Próxima verificação em {intervalo_minutos} minutos...")
             time.sleep(intervalo_minutos * 60)
@@ -230,5 +270,10 @@ if __name__ == "__main__":
     # Execução única
     main()
     
+    # Para rodar offline (CI/benchmarks), grave um cassete uma vez e reproduza:
+    # from cache_http import CacheHTTP
+    # main(cache=CacheHTTP(modo='gravar', cassete='cassete_g1.json'))
+    # main(cache=CacheHTTP(modo='reproduzir', cassete='cassete_g1.json'))
+    
     # Para monitoramento contínuo, descomente a linha abaixo:
     # monitorar_noticias(30)  # Verifica a cada 30 minutos
\ No newline at end of file
@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import re
+import time
+
+import requests
+
+class CacheHTTP:
+    """Cache HTTP em disco para as requisições do scraper.
+
+    Respeita `Cache-Control` (max-age, no-store, no-cache), revalida respostas
+    expiradas com ETag/Last-Modified e descarta as menos usadas quando o
+    diretório passa do tamanho máximo (LRU pelo mtime dos arquivos).
+
+    Modos:
+        'normal'     - usa o cache e a rede normalmente
+        'gravar'     - faz as requisições e grava as respostas no cassete
+        'reproduzir' - responde apenas com o cassete, sem acessar a rede
+    """
+
+    MODOS = ('normal', 'gravar', 'reproduzir')
+
+    def __init__(self, diretorio=".cache_http", tamanho_maximo_mb=100, modo='normal',
+                 cassete=None, max_age_padrao=0):
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo inválido: {modo}. Use um de {self.MODOS}")
+        if modo != 'normal' and cassete is None:
+            raise ValueError(f"O modo '{modo}' exige um arquivo de cassete")
+
+        self.diretorio = diretorio
+        self.tamanho_maximo = tamanho_maximo_mb * 1024 * 1024
+        self.modo = modo
+        self.cassete = cassete
+        self.max_age_padrao = max_age_padrao
+        self.acertos = 0
+        self.falhas = 0
+
+        os.makedirs(self.diretorio, exist_ok=True)
+        self.gravacoes = self.carregar_cassete() if cassete else {}
+
+    # ------------------------------------------------------------------
+    # Cassete (gravar / reproduzir)
+    # ------------------------------------------------------------------
+
+    def carregar_cassete(self):
+        """Lê o cassete do disco ({url: {status, corpo}})"""
+        if not os.path.exists(self.cassete):
+            if self.modo == 'reproduzir':
+                raise FileNotFoundError(f"Cassete não encontrado: {self.cassete}")
+            return {}
+
+        with open(self.cassete, 'r', encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+
+    def salvar_cassete(self):
+        """Grava o cassete de forma atômica"""
+        temporario = self.cassete + ".tmp"
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.gravacoes, arquivo, ensure_ascii=False, indent=2)
+        os.replace(temporario, self.cassete)
+
+    # ------------------------------------------------------------------
+    # Armazenamento em disco
+    # ------------------------------------------------------------------
+
+    def caminhos(self, url):
+        """Retorna os caminhos (corpo, metadados) da entrada de uma URL"""
+        chave = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.diretorio, chave)
+        return base + ".body", base + ".json"
+
+    def ler_entrada(self, url):
+        """Lê uma entrada do cache; retorna (metadados, corpo) ou (None, None)"""
+        caminho_corpo, caminho_meta = self.caminhos(url)
+        try:
+            with open(caminho_meta, 'r', encoding='utf-8') as arquivo:
+                meta = json.load(arquivo)
+            with open(caminho_corpo, 'rb') as arquivo:
+                corpo = arquivo.read()
+        except (OSError, ValueError):
+            return None, None
+
+        # Atualiza o mtime: é o que define a ordem LRU
+        os.utime(caminho_meta)
+        return meta, corpo
+
+    def gravar_entrada(self, url, meta, corpo):
+        """Grava uma entrada no cache e aplica o limite de tamanho"""
+        caminho_corpo, caminho_meta = self.caminhos(url)
+        with open(caminho_corpo, 'wb') as arquivo:
+            arquivo.write(corpo)
+        with open(caminho_meta, 'w', encoding='utf-8') as arquivo:
+            json.dump(meta, arquivo)
+        self.aplicar_limite()
+
+    def invalidar(self, url):
+        """
+        Descarta a entrada de uma URL (ex.: o corpo guardado não parseou)
+
+        Sem isso, um corpo ruim seria revalidado com o mesmo ETag e voltaria
+        via 304 até o servidor publicar outra versão. No modo 'gravar' a
+        gravação também sai do cassete; no 'reproduzir' o cassete não muda.
+        """
+        for caminho in self.caminhos(url):
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+        if self.modo == 'gravar' and self.gravacoes.pop(url, None) is not None:
+            self.salvar_cassete()
+
+    def aplicar_limite(self):
+        """Remove as entradas usadas há mais tempo até caber no tamanho máximo"""
+        entradas = []
+        total = 0
+        for nome in os.listdir(self.diretorio):
+            if not nome.endswith(".json"):
+                continue
+            caminho_meta = os.path.join(self.diretorio, nome)
+            caminho_corpo = caminho_meta[:-5] + ".body"
+            try:
+                tamanho = os.path.getsize(caminho_meta) + os.path.getsize(caminho_corpo)
+                entradas.append((os.path.getmtime(caminho_meta), tamanho, caminho_meta, caminho_corpo))
+            except OSError:
+                continue
+            total += tamanho
+
+        for _, tamanho, caminho_meta, caminho_corpo in sorted(entradas):
+            if total <= self.tamanho_maximo:
+                break
+            for caminho in (caminho_meta, caminho_corpo):
+                try:
+                    os.remove(caminho)
+                except OSError:
+                    pass
+            total -= tamanho
+
+    def calcular_validade(self, headers):
+        """
+        Interpreta o Cache-Control da resposta
+
+        Returns:
+            float: Segundos de validade, ou None se a resposta não puder ser guardada
+        """
+        cache_control = headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            return None
+        if 'no-cache' in cache_control:
+            return 0
+
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+        if max_age:
+            return int(max_age.group(1))
+        return self.max_age_padrao
+
+    # ------------------------------------------------------------------
+    # Requisição
+    # ------------------------------------------------------------------
+
+    def obter(self, url, headers=None, timeout=10):
+        """
+        Retorna o corpo da URL, usando o cache quando possível
+
+        Args:
+            url (str): URL a ser acessada
+            headers (dict): Headers da requisição
+            timeout (float): Timeout da requisição em segundos
+
+        Returns:
+            str: Conteúdo da resposta (UTF-8)
+
+        Raises:
+            requests.exceptions.RequestException: Em erros de rede/HTTP ou
+                quando a URL não está no cassete no modo 'reproduzir'
+        """
+        if self.modo == 'reproduzir':
+            gravacao = self.gravacoes.get(url)
+            if gravacao is None:
+                raise requests.exceptions.ConnectionError(f"URL não gravada no cassete: {url}")
+            if gravacao['status'] >= 400:
+                raise requests.exceptions.HTTPError(f"{gravacao['status']} (cassete) para url: {url}")
+            self.acertos += 1
+            return gravacao['corpo']
+
+        conteudo = self.obter_do_cache_ou_rede(url, headers, timeout)
+        if self.modo == 'gravar':
+            self.gravar_no_cassete(url, 200, conteudo)
+        return conteudo
+
+    def gravar_no_cassete(self, url, status, corpo):
+        """Registra a resposta de uma URL no cassete"""
+        self.gravacoes[url] = {'status': status, 'corpo': corpo}
+        self.salvar_cassete()
+
+    def obter_do_cache_ou_rede(self, url, headers, timeout):
+        """Responde pelo cache em disco, revalidando ou indo à rede se preciso"""
+        meta, corpo = self.ler_entrada(url)
+        if meta is not None and time.time() < meta['expira_em']:
+            self.acertos += 1
+            return corpo.decode('utf-8')
+
+        self.falhas += 1
+        headers = dict(headers or {})
+        if meta is not None:
+            # Revalidação condicional: 304 reaproveita o corpo guardado
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        response = requests.get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and meta is not None:
+            meta['expira_em'] = time.time() + (self.calcular_validade(response.headers) or 0)
+            self.gravar_entrada(url, meta, corpo)
+            return corpo.decode('utf-8')
+
+        if response.status_code >= 400 and self.modo == 'gravar':
+            self.gravar_no_cassete(url, response.status_code, "")
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        conteudo = response.text
+
+        validade = self.calcular_validade(response.headers)
+        if validade is not None:
+            self.gravar_entrada(url, {
+                'url': url,
+                'expira_em': time.time() + validade,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }, conteudo.encode('utf-8'))
+
+        return conteudo
@@ -0,0 +1,222 @@
+"""
+CLI DO SCRAPER G1
+Uso:
+    python cli_g1.py run [--url URL] [--se-modificado] [--sem-arquivos] [--limite N]
+    python cli_g1.py monitor [--intervalo MINUTOS]
+    python cli_g1.py export --db noticias_g1.db --saida noticias.csv
+    python cli_g1.py stats [--arquivo agregados_g1.json] [--janela HORAS]
+
+Os módulos pesados (requests, o scraper, sqlite3) só são importados dentro do
+subcomando que precisa deles, então execuções que não fazem nada — ou que
+recebem 304 com `--se-modificado` — iniciam bem mais rápido.
+"""
+
+import argparse
+import sys
+
+URL_PADRAO = "https://g1.globo.com/rss/g1/brasil/"
+ARQUIVO_ESTADO = ".estado_cli_g1.json"
+
+def carregar_estado(caminho):
+    """Lê os validadores (ETag/Last-Modified) salvos por URL"""
+    import json
+    try:
+        with open(caminho, 'r', encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return {}
+
+def salvar_estado(caminho, estado):
+    """Grava os validadores por URL"""
+    import json
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(estado, arquivo)
+
+def baixar_se_modificado(url, headers, arquivo_estado=ARQUIVO_ESTADO):
+    """
+    Requisição condicional usando apenas a biblioteca padrão
+
+    Os validadores não são gravados aqui: quem chama só deve usar
+    `salvar_validadores` depois de processar o conteúdo com sucesso, senão
+    uma versão que falhou no parsing nunca mais seria baixada (304).
+
+    Returns:
+        tuple: (conteúdo, validadores) ou (None, None) se o servidor respondeu 304
+    """
+    import urllib.error
+    import urllib.request
+
+    validadores = carregar_estado(arquivo_estado).get(url, {})
+
+    headers = dict(headers)
+    if validadores.get('etag'):
+        headers['If-None-Match'] = validadores['etag']
+    if validadores.get('last_modified'):
+        headers['If-Modified-Since'] = validadores['last_modified']
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=10) as resposta:
+            conteudo = resposta.read().decode('utf-8')
+            novos_validadores = {
+                'etag': resposta.headers.get('ETag'),
+                'last_modified': resposta.headers.get('Last-Modified'),
+            }
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, None
+        raise
+
+    return conteudo, novos_validadores
+
+def salvar_validadores(url, validadores, arquivo_estado=ARQUIVO_ESTADO):
+    """Registra os validadores de uma URL já processada"""
+    estado = carregar_estado(arquivo_estado)
+    estado[url] = validadores
+    salvar_estado(arquivo_estado, estado)
+
+def comando_run(args):
+    """Subcomando `run`: uma raspagem única"""
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+    conteudo = validadores = None
+    if args.se_modificado:
+        try:
+            conteudo, validadores = baixar_se_modificado(args.url, headers)
+        except OSError as e:
+            print(f"Erro ao fazer requisição: {e}")
+            return 1
+        if conteudo is None:
+            print("Feed não modificado (304). Nada a fazer.")
+            return 0
+
+    from bs4_g1rss_monitoramento import G1RSScraper
+
+    scraper = G1RSScraper()
+    scraper.url = args.url
+
+    if conteudo is None:
+        sucesso = scraper.executar_raspagem(
+            salvar_arquivos=not args.sem_arquivos,
+            exibir=args.limite > 0,
+            limite_exibicao=args.limite,
+        )
+    else:
+        sucesso = scraper.parsear_rss(conteudo)
+        if sucesso and args.limite > 0:
+            scraper.exibir_noticias(args.limite)
+        if sucesso and not args.sem_arquivos:
+            # Avalia os dois para não pular o JSON quando o CSV falha
+            salvos = [scraper.salvar_csv(), scraper.salvar_json()]
+            sucesso = all(salvos)
+        if sucesso:
+            salvar_validadores(args.url, validadores)
+
+    print(f"Total de notícias coletadas: {len(scraper.noticias)}")
+    return 0 if sucesso else 1
+
+def comando_monitor(args):
+    """Subcomando `monitor`: monitoramento contínuo"""
+    from bs4_g1rss_monitoramento import monitorar_noticias
+
+    perfilador = None
+    if args.perfil_cpu or args.perfil_memoria or args.limite_rss_mb or args.limite_crescimento_mb:
+        from perfilamento import PerfiladorCiclos
+        perfilador = PerfiladorCiclos(
+            diretorio=args.diretorio_perfil,
+            cpu=args.perfil_cpu,
+            memoria=args.perfil_memoria,
+            limite_rss_mb=args.limite_rss_mb,
+            limite_crescimento_mb=args.limite_crescimento_mb,
+            acao_limite='reiniciar' if args.reiniciar else 'alertar',
+        )
+
+    monitorar_noticias(args.intervalo, arquivo_agregados=args.agregados, perfilador=perfilador)
+    return 0
+
+def comando_export(args):
+    """Subcomando `export`: exporta as notícias do SQLite para CSV ou JSON"""
+    import sqlite3
+    from pipeline_g1.destinos import CAMPOS, DestinoCSV, DestinoJSON
+
+    destino = DestinoJSON(args.saida) if args.saida.endswith('.json') else DestinoCSV(args.saida)
+    conexao = sqlite3.connect(args.db)
+    conexao.row_factory = sqlite3.Row
+    total = 0
+    try:
+        cursor = conexao.execute(f"SELECT {', '.join(CAMPOS)} FROM noticias")
+        while True:
+            lote = [dict(linha) for linha in cursor.fetchmany(1000)]
+            if not lote:
+                break
+            destino.gravar_lote(lote)
+            total += len(lote)
+    except sqlite3.Error as e:
+        print(f"Erro ao ler o banco {args.db}: {e}")
+        return 1
+    finally:
+        destino.fechar()
+        conexao.close()
+
+    print(f"{total} notícias exportadas para {args.saida}")
+    return 0
+
+def comando_stats(args):
+    """Subcomando `stats`: estatísticas acumuladas pelo monitoramento"""
+    from agregados_incrementais import AgregadorIncremental
+
+    agregador = AgregadorIncremental(args.arquivo)
+    agregador.exibir_resumo(janela_horas=args.janela, n=args.top)
+    return 0
+
+def criar_parser():
+    """Monta o parser de argumentos com os subcomandos"""
+    parser = argparse.ArgumentParser(prog="cli_g1", description="Scraper do feed RSS do G1")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    run = subparsers.add_parser("run", help="Executa uma raspagem")
+    run.add_argument("--url", default=URL_PADRAO)
+    run.add_argument("--se-modificado", action="store_true",
+                     help="Usa requisição condicional e encerra se o feed não mudou (304)")
+    run.add_argument("--sem-arquivos", action="store_true", help="Não grava CSV/JSON")
+    run.add_argument("--limite", type=int, default=0, help="Quantas notícias exibir")
+    run.set_defaults(funcao=comando_run)
+
+    monitor = subparsers.add_parser("monitor", help="Monitora o feed continuamente")
+    monitor.add_argument("--intervalo", type=float, default=30, help="Intervalo em minutos")
+    monitor.add_argument("--agregados", default="agregados_g1.json")
+    monitor.add_argument("--perfil-cpu", choices=["cprofile", "amostragem"],
+                         help="Perfil de CPU por ciclo ('amostragem' requer pyinstrument)")
+    monitor.add_argument("--perfil-memoria", action="store_true",
+                         help="Diferença de tracemalloc entre ciclos")
+    monitor.add_argument("--diretorio-perfil", default="perfil_monitoramento")
+    monitor.add_argument("--limite-rss-mb", type=float, help="RSS máximo antes de alertar/reiniciar")
+    monitor.add_argument("--limite-crescimento-mb", type=float,
+                         help="Crescimento máximo de RSS desde o primeiro ciclo")
+    monitor.add_argument("--reiniciar", action="store_true",
+                         help="Reinicia o processo ao exceder um limite (padrão: só alerta)")
+    monitor.set_defaults(funcao=comando_monitor)
+
+    export = subparsers.add_parser("export", help="Exporta notícias do SQLite")
+    export.add_argument("--db", default="noticias_g1.db")
+    export.add_argument("--saida", default="noticias_g1_brasil.csv", help="Arquivo .csv ou .json")
+    export.set_defaults(funcao=comando_export)
+
+    stats = subparsers.add_parser("stats", help="Exibe as estatísticas acumuladas")
+    stats.add_argument("--arquivo", default="agregados_g1.json")
+    stats.add_argument("--janela", type=int, default=24, help="Janela em horas")
+    stats.add_argument("--top", type=int, default=3)
+    stats.set_defaults(funcao=comando_stats)
+
+    return parser
+
+def main(argv=None):
+    """Ponto de entrada da CLI"""
+    args = criar_parser().parse_args(argv)
+    try:
+        return args.funcao(args)
+    except KeyboardInterrupt:
+        print("\nInterrompido pelo usuário.")
+        return 130
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,388 @@
+import sqlite3
+import time
+import os
+from contextlib import closing
+from datetime import datetime
+from multiprocessing import Process
+
+from bs4_g1rss_monitoramento import G1RSScraper
+
+class FilaTrabalho:
+    """Fila durável em SQLite com leases e timeout de visibilidade.
+
+    Cada tarefa pode ser reivindicada por um worker por um período (lease).
+    Se o worker morrer antes de confirmar, a tarefa volta a ficar visível
+    quando o lease expira, garantindo entrega pelo menos uma vez.
+
+    Os workers podem ser vários processos, mas na mesma máquina: o modo WAL
+    do SQLite depende de memória compartilhada e não funciona com o banco
+    em um sistema de arquivos de rede (NFS/SMB).
+    """
+
+    def __init__(self, caminho_db="fila_g1.db", timeout_visibilidade=60, max_tentativas=5):
+        self.caminho_db = caminho_db
+        self.timeout_visibilidade = timeout_visibilidade
+        self.max_tentativas = max_tentativas
+        self.criar_tabelas()
+
+    def conectar(self):
+        """
+        Abre uma conexão nova (uma por processo)
+
+        Em modo autocommit o `with conexao` do sqlite3 não fecha nada; use
+        `closing(self.conectar())` ou feche explicitamente.
+        """
+        conexao = sqlite3.connect(self.caminho_db, timeout=30, isolation_level=None)
+        conexao.execute("PRAGMA journal_mode=WAL")
+        conexao.execute("PRAGMA synchronous=NORMAL")
+        return conexao
+
+    def criar_tabelas(self):
+        """Cria as tabelas da fila e das notícias, se ainda não existirem"""
+        with closing(self.conectar()) as conexao:
+            conexao.executescript("""
+                CREATE TABLE IF NOT EXISTS tarefas (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tipo TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    estado TEXT NOT NULL DEFAULT 'pendente',
+                    tentativas INTEGER NOT NULL DEFAULT 0,
+                    visivel_em REAL NOT NULL,
+                    dono TEXT,
+                    erro TEXT,
+                    criado_em REAL NOT NULL,
+                    UNIQUE (tipo, url)
+                );
+                CREATE INDEX IF NOT EXISTS idx_tarefas_visiveis
+                    ON tarefas (estado, visivel_em);
+                CREATE TABLE IF NOT EXISTS noticias (
+                    guid TEXT PRIMARY KEY,
+                    titulo TEXT,
+                    link TEXT,
+                    descricao TEXT,
+                    categoria TEXT,
+                    data_publicacao TEXT,
+                    data_formatada TEXT,
+                    data_raspagem TEXT,
+                    feed TEXT
+                );
+                CREATE TABLE IF NOT EXISTS artigos (
+                    url TEXT PRIMARY KEY,
+                    html TEXT,
+                    tamanho INTEGER,
+                    data_raspagem TEXT
+                );
+            """)
+
+    def enfileirar(self, tipo, url, atraso=0):
+        """
+        Adiciona uma tarefa à fila (ignora duplicatas)
+
+        Só tarefas de feed já concluídas ou falhas são reagendadas: cada
+        verificação do feed precisa rodar de novo, mas um artigo já baixado
+        não deve ser baixado outra vez a cada notícia repetida no feed.
+
+        Args:
+            tipo (str): 'feed' ou 'artigo'
+            url (str): URL a ser processada
+            atraso (float): Segundos até a tarefa ficar visível
+
+        Returns:
+            bool: True se a tarefa foi inserida ou reagendada
+        """
+        agora = time.time()
+        with closing(self.conectar()) as conexao:
+            cursor = conexao.execute(
+                """
+                INSERT INTO tarefas (tipo, url, visivel_em, criado_em)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (tipo, url) DO UPDATE SET
+                    estado = 'pendente', tentativas = 0, erro = NULL,
+                    dono = NULL, visivel_em = excluded.visivel_em
+                WHERE tarefas.tipo = 'feed' AND tarefas.estado IN ('concluida', 'falhou')
+                """,
+                (tipo, url, agora + atraso, agora),
+            )
+            return cursor.rowcount > 0
+
+    def reivindicar(self, dono):
+        """
+        Reivindica a próxima tarefa visível, aplicando um lease
+
+        Args:
+            dono (str): Identificador do worker
+
+        Returns:
+            tuple: (id, tipo, url, tentativas) ou None se a fila estiver vazia
+        """
+        agora = time.time()
+        conexao = self.conectar()
+        try:
+            # BEGIN IMMEDIATE serializa os workers na reivindicação
+            conexao.execute("BEGIN IMMEDIATE")
+            # Lease expirado sem tentativas restantes: o worker morreu em todas
+            # elas, então a tarefa é descartada em vez de reentregue para sempre
+            conexao.execute(
+                """
+                UPDATE tarefas SET estado = 'falhou', dono = NULL,
+                    erro = 'Lease expirado após ' || tentativas || ' tentativas'
+                WHERE estado = 'em_andamento' AND visivel_em <= ? AND tentativas >= ?
+                """,
+                (agora, self.max_tentativas),
+            )
+            linha = conexao.execute(
+                """
+                SELECT id, tipo, url, tentativas FROM tarefas
+                WHERE estado IN ('pendente', 'em_andamento') AND visivel_em <= ?
+                ORDER BY visivel_em LIMIT 1
+                """,
+                (agora,),
+            ).fetchone()
+            if linha is None:
+                conexao.execute("COMMIT")
+                return None
+
+            conexao.execute(
+                """
+                UPDATE tarefas SET estado = 'em_andamento', dono = ?,
+                    tentativas = tentativas + 1, visivel_em = ?
+                WHERE id = ?
+                """,
+                (dono, agora + self.timeout_visibilidade, linha[0]),
+            )
+            conexao.execute("COMMIT")
+            return (linha[0], linha[1], linha[2], linha[3] + 1)
+        except Exception:
+            # Se o próprio BEGIN falhou (banco travado), não há o que desfazer
+            # e um ROLLBACK esconderia o erro original
+            if conexao.in_transaction:
+                conexao.execute("ROLLBACK")
+            raise
+        finally:
+            conexao.close()
+
+    def confirmar(self, id_tarefa, dono):
+        """Marca a tarefa como concluída (apenas se o lease ainda for do worker)"""
+        with closing(self.conectar()) as conexao:
+            cursor = conexao.execute(
+                "UPDATE tarefas SET estado = 'concluida', dono = NULL "
+                "WHERE id = ? AND dono = ? AND estado = 'em_andamento'",
+                (id_tarefa, dono),
+            )
+            return cursor.rowcount > 0
+
+    def falhar(self, id_tarefa, dono, erro, tentativas):
+        """Devolve a tarefa à fila com backoff, ou a marca como falha definitiva"""
+        if tentativas >= self.max_tentativas:
+            estado, visivel_em = 'falhou', time.time()
+        else:
+            estado, visivel_em = 'pendente', time.time() + min(2 ** tentativas, 300)
+
+        with closing(self.conectar()) as conexao:
+            conexao.execute(
+                "UPDATE tarefas SET estado = ?, visivel_em = ?, erro = ?, dono = NULL "
+                "WHERE id = ? AND dono = ?",
+                (estado, visivel_em, str(erro), id_tarefa, dono),
+            )
+
+    def estender_lease(self, id_tarefa, dono):
+        """Renova o lease de uma tarefa demorada"""
+        with closing(self.conectar()) as conexao:
+            conexao.execute(
+                "UPDATE tarefas SET visivel_em = ? WHERE id = ? AND dono = ?",
+                (time.time() + self.timeout_visibilidade, id_tarefa, dono),
+            )
+
+    def contar_por_estado(self):
+        """Retorna um dicionário {estado: quantidade}"""
+        with closing(self.conectar()) as conexao:
+            return dict(conexao.execute(
+                "SELECT estado, COUNT(*) FROM tarefas GROUP BY estado"
+            ).fetchall())
+
+    def salvar_noticias(self, noticias, feed):
+        """
+        Grava as notícias de forma idempotente (upsert por GUID)
+
+        O GUID é opcional no RSS; sem ele a chave é o link (como em
+        RegistroRevisoes.chave), senão todas cairiam na linha "N/A".
+        """
+        with closing(self.conectar()) as conexao:
+            conexao.executemany(
+                """
+                INSERT OR REPLACE INTO noticias
+                    (guid, titulo, link, descricao, categoria, data_publicacao,
+                     data_formatada, data_raspagem, feed)
+                VALUES (:guid, :titulo, :link, :descricao, :categoria,
+                        :data_publicacao, :data_formatada, :data_raspagem, :feed)
+                """,
+                [
+                    dict(noticia, feed=feed,
+                         guid=noticia['guid'] if noticia.get('guid', "N/A") != "N/A" else noticia['link'])
+                    for noticia in noticias
+                ],
+            )
+
+    def salvar_artigo(self, url, html):
+        """Grava o HTML de um artigo (upsert por URL)"""
+        with closing(self.conectar()) as conexao:
+            conexao.execute(
+                "INSERT OR REPLACE INTO artigos (url, html, tamanho, data_raspagem) "
+                "VALUES (?, ?, ?, ?)",
+                (url, html, len(html), datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            )
+
+
+def processar_feed(fila, url, enfileirar_artigos=True):
+    """
+    Baixa e parseia um feed, grava as notícias e enfileira os artigos
+
+    Returns:
+        int: Quantidade de notícias gravadas
+    """
+    scraper = G1RSScraper()
+    scraper.url = url
+
+    xml_content = scraper.fazer_requisicao()
+    if not xml_content:
+        raise RuntimeError(f"Falha ao baixar o feed {url}")
+    if not scraper.parsear_rss(xml_content):
+        raise RuntimeError(f"Falha ao parsear o feed {url}")
+
+    fila.salvar_noticias(scraper.noticias, url)
+
+    if enfileirar_artigos:
+        for noticia in scraper.noticias:
+            if noticia['link'] != "N/A":
+                fila.enfileirar('artigo', noticia['link'])
+
+    return len(scraper.noticias)
+
+
+def processar_artigo(fila, url):
+    """Baixa a página de um artigo e grava o HTML bruto"""
+    scraper = G1RSScraper()
+    scraper.url = url
+
+    html = scraper.fazer_requisicao()
+    if html is None:
+        raise RuntimeError(f"Falha ao baixar o artigo {url}")
+
+    fila.salvar_artigo(url, html)
+
+
+def executar_worker(caminho_db="fila_g1.db", enfileirar_artigos=True, parar_quando_vazia=False,
+                    intervalo_ocioso=2, timeout_visibilidade=60):
+    """
+    Loop de um worker: reivindica, processa e confirma tarefas
+
+    Erros do banco (ex.: "database is locked" após o timeout) não encerram
+    o worker: são registrados e a operação é tentada de novo com backoff.
+
+    Args:
+        caminho_db (str): Caminho do banco SQLite compartilhado
+        enfileirar_artigos (bool): Se tarefas de feed devem gerar tarefas de artigo
+        parar_quando_vazia (bool): Encerra quando não houver mais tarefas (útil em testes)
+        intervalo_ocioso (float): Espera, em segundos, quando a fila está vazia
+        timeout_visibilidade (float): Duração do lease de cada tarefa
+
+    Returns:
+        int: Quantidade de tarefas concluídas
+    """
+    fila = FilaTrabalho(caminho_db, timeout_visibilidade=timeout_visibilidade)
+    # Todos os workers rodam na mesma máquina (ver FilaTrabalho): o PID basta
+    dono = f"worker-{os.getpid()}"
+    concluidas = 0
+    erros_banco = 0
+
+    print(f"Worker {dono} iniciado.")
+
+    while True:
+        try:
+            tarefa = fila.reivindicar(dono)
+            if tarefa is None:
+                if parar_quando_vazia:
+                    break
+                time.sleep(intervalo_ocioso)
+                continue
+
+            id_tarefa, tipo, url, tentativas = tarefa
+            try:
+                if tipo == 'feed':
+                    total = processar_feed(fila, url, enfileirar_artigos)
+                    print(f"[{dono}] Feed {url}: {total} notícias")
+                elif tipo == 'artigo':
+                    processar_artigo(fila, url)
+                else:
+                    raise ValueError(f"Tipo de tarefa desconhecido: {tipo}")
+            except Exception as e:
+                print(f"[{dono}] Erro na tarefa {id_tarefa} ({url}): {e}")
+                fila.falhar(id_tarefa, dono, e, tentativas)
+                continue
+
+            if fila.confirmar(id_tarefa, dono):
+                concluidas += 1
+            erros_banco = 0
+
+        except sqlite3.OperationalError as e:
+            erros_banco += 1
+            espera = min(intervalo_ocioso * 2 ** (erros_banco - 1), 60)
+            print(f"[{dono}] Erro no banco da fila: {e}. Nova tentativa em {espera:.1f}s")
+            time.sleep(espera)
+        except KeyboardInterrupt:
+            print(f"\nWorker {dono} interrompido.")
+            break
+
+    print(f"Worker {dono} encerrado. Tarefas concluídas: {concluidas}")
+    return concluidas
+
+
+def agendar_feeds(urls, caminho_db="fila_g1.db", intervalo_minutos=None):
+    """
+    Agendador: enfileira as URLs dos feeds, opcionalmente em intervalos
+
+    Args:
+        urls (list): URLs dos feeds RSS
+        caminho_db (str): Caminho do banco SQLite compartilhado
+        intervalo_minutos (float): Se informado, reenfileira continuamente
+    """
+    fila = FilaTrabalho(caminho_db)
+
+    while True:
+        for url in urls:
+            fila.enfileirar('feed', url)
+        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {len(urls)} feeds agendados. "
+              f"Estado da fila: {fila.contar_por_estado()}")
+
+        if intervalo_minutos is None:
+            break
+        try:
+            time.sleep(intervalo_minutos * 60)
+        except KeyboardInterrupt:
+            print("\nAgendador interrompido.")
+            break
+
+
+def executar_workers(num_workers=4, caminho_db="fila_g1.db", **kwargs):
+    """Inicia N processos worker locais e aguarda o término"""
+    processos = [
+        Process(target=executar_worker, args=(caminho_db,), kwargs=kwargs)
+        for _ in range(num_workers)
+    ]
+    for processo in processos:
+        processo.start()
+    for processo in processos:
+        processo.join()
+
+
+def main():
+    """Exemplo: agenda o feed do G1 e processa com 4 workers locais"""
+    caminho_db = "fila_g1.db"
+    agendar_feeds(["https://g1.globo.com/rss/g1/brasil/"], caminho_db)
+    executar_workers(num_workers=4, caminho_db=caminho_db, parar_quando_vazia=True)
+
+    fila = FilaTrabalho(caminho_db)
+    print(f"\nEstado final da fila: {fila.contar_por_estado()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# src/components/inspecao_arquivos.py
+"""
+INSPEÇÃO RÁPIDA DE ARQUIVOS CSV
+Objetivo: Contar registros, ler o início e o fim de CSVs grandes
+sem carregar o arquivo inteiro na memória
+"""
+
+import csv
+import io
+import os
+
+TAMANHO_BLOCO = 1024 * 1024  # 1 MB
+
+def contar_registros_csv(nome_arquivo):
+    """
+    Conta os registros de um CSV (incluindo o cabeçalho) varrendo os bytes
+
+    Quebras de linha dentro de campos entre aspas não contam como novo
+    registro. Blocos sem aspas são contados direto com `bytes.count`, que
+    roda em C; só os blocos com aspas precisam ser divididos.
+
+    Args:
+        nome_arquivo (str): Caminho do CSV
+
+    Returns:
+        int: Quantidade de registros
+    """
+    registros = 0
+    dentro_aspas = False
+    ultimo_byte = b"\n"
+
+    with open(nome_arquivo, 'rb') as arquivo:
+        while True:
+            bloco = arquivo.read(TAMANHO_BLOCO)
+            if not bloco:
+                break
+
+            if not dentro_aspas and b'"' not in bloco:
+                registros += bloco.count(b"\n")
+            else:
+                # Os trechos entre aspas alternam; "" (aspas escapadas) gera um
+                # trecho vazio e mantém o estado correto
+                trechos = bloco.split(b'"')
+                inicio = 1 if dentro_aspas else 0
+                registros += sum(trecho.count(b"\n") for trecho in trechos[inicio::2])
+                if len(trechos) % 2 == 0:
+                    dentro_aspas = not dentro_aspas
+
+            ultimo_byte = bloco[-1:]
+
+    # Último registro sem quebra de linha no final
+    if ultimo_byte != b"\n":
+        registros += 1
+
+    return registros
+
+def estimar_registros_csv(nome_arquivo, amostra_bytes=TAMANHO_BLOCO):
+    """
+    Estima a quantidade de registros pelo tamanho médio de uma amostra inicial
+
+    Args:
+        nome_arquivo (str): Caminho do CSV
+        amostra_bytes (int): Quantos bytes do início usar na amostra
+
+    Returns:
+        int: Estimativa de registros (exata se o arquivo couber na amostra)
+    """
+    tamanho = os.path.getsize(nome_arquivo)
+    if tamanho <= amostra_bytes:
+        return contar_registros_csv(nome_arquivo)
+
+    with open(nome_arquivo, 'r', encoding='utf-8', newline='', errors='replace') as arquivo:
+        amostra = arquivo.read(amostra_bytes)
+
+    # Descarta o último registro, provavelmente cortado
+    linhas = list(csv.reader(io.StringIO(amostra)))[:-1]
+    if not linhas:
+        return 1
+
+    bytes_amostra = len(amostra.encode('utf-8'))
+    return round(tamanho * len(linhas) / bytes_amostra)
+
+def ler_cabeca_csv(nome_arquivo, linhas=5):
+    """
+    Lê o cabeçalho e as primeiras linhas de um CSV
+
+    Args:
+        nome_arquivo (str): Caminho do CSV
+        linhas (int): Quantas linhas de dados ler
+
+    Returns:
+        tuple: (cabecalho, lista de linhas)
+    """
+    with open(nome_arquivo, 'r', encoding='utf-8', newline='') as arquivo:
+        reader = csv.reader(arquivo)
+        cabecalho = next(reader, [])
+        dados = []
+        for linha in reader:
+            if len(dados) >= linhas:
+                break
+            dados.append(linha)
+
+    return cabecalho, dados
+
+def ler_cauda_csv(nome_arquivo, linhas=5):
+    """
+    Lê as últimas linhas de um CSV posicionando a leitura no final do arquivo
+
+    Como não dá para saber, olhando de trás para frente, se uma quebra de linha
+    está dentro de aspas, o trecho lido é parseado a partir de cada quebra de
+    linha candidata até que todas as linhas tenham o número de colunas do
+    cabeçalho. O trecho dobra de tamanho até conter linhas suficientes.
+
+    Args:
+        nome_arquivo (str): Caminho do CSV
+        linhas (int): Quantas linhas de dados ler
+
+    Returns:
+        tuple: (cabecalho, lista de linhas)
+    """
+    cabecalho, _ = ler_cabeca_csv(nome_arquivo, 0)
+    tamanho = os.path.getsize(nome_arquivo)
+    bloco = 64 * 1024
+
+    with open(nome_arquivo, 'rb') as arquivo:
+        while True:
+            inicio = max(0, tamanho - bloco)
+            arquivo.seek(inicio)
+            dados = arquivo.read()
+
+            if inicio == 0:
+                texto = dados.decode('utf-8', errors='replace')
+                return cabecalho, list(csv.reader(io.StringIO(texto, newline='')))[1:][-linhas:]
+
+            posicao = dados.find(b"\n")
+            while posicao != -1:
+                texto = dados[posicao + 1:].decode('utf-8', errors='replace')
+                try:
+                    registros = list(csv.reader(io.StringIO(texto, newline=''), strict=True))
+                except csv.Error:
+                    registros = None
+
+                if registros is not None and all(len(r) == len(cabecalho) for r in registros):
+                    if len(registros) >= linhas:
+                        return cabecalho, registros[-linhas:]
+                    break
+
+                posicao = dados.find(b"\n", posicao + 1)
+
+            bloco *= 2
+
+def informacoes_arquivo(nome_arquivo, contar_exato=False):
+    """
+    Reúne tamanho e quantidade de registros de um arquivo
+
+    Args:
+        nome_arquivo (str): Caminho do arquivo
+        contar_exato (bool): Se False, usa a estimativa por amostragem
+
+    Returns:
+        dict: Informações do arquivo
+    """
+    info = {'tamanho': os.path.getsize(nome_arquivo)}
+    if nome_arquivo.endswith('.csv'):
+        if contar_exato:
+            info['registros'] = contar_registros_csv(nome_arquivo)
+        else:
+            info['registros_estimados'] = estimar_registros_csv(nome_arquivo)
+    return info
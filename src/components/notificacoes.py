@@ -0,0 +1,286 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+class DestinoWebhook:
+    """Entrega lotes de notícias via POST JSON para uma URL"""
+
+    def __init__(self, url, timeout=10, nome=None):
+        self.url = url
+        self.timeout = timeout
+        self.nome = nome or url
+
+    def entregar(self, lote):
+        response = requests.post(self.url, json={'noticias': lote}, timeout=self.timeout)
+        response.raise_for_status()
+
+class DestinoArquivoJSONL:
+    """Fila de mensagens local: acrescenta cada notícia como uma linha JSON"""
+
+    def __init__(self, nome_arquivo="notificacoes_g1.jsonl", nome=None):
+        self.nome_arquivo = nome_arquivo
+        self.nome = nome or nome_arquivo
+        self.trava = threading.Lock()
+
+    def entregar(self, lote):
+        linhas = "".join(json.dumps(noticia, ensure_ascii=False) + "\n" for noticia in lote)
+        with self.trava, open(self.nome_arquivo, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(linhas)
+
+class DespachanteNotificacoes:
+    """Envia notícias para consumidores sem bloquear o loop de monitoramento.
+
+    `enviar` só coloca as notícias em uma fila limitada em memória e retorna.
+    Um loop asyncio em uma thread separada agrupa as notícias em lotes (por
+    quantidade ou por tempo), entrega cada lote a todos os destinos em
+    paralelo e repete com backoff em caso de erro. Quando a fila está cheia
+    ou um destino esgota as tentativas, o lote é derramado em disco (JSONL) e
+    reenviado depois. A entrega é pelo menos uma vez.
+    """
+
+    def __init__(self, destinos, tamanho_lote=50, intervalo_lote=5.0, tamanho_fila=10000,
+                 max_concorrencia=4, max_tentativas=5, arquivo_derramamento="notificacoes_pendentes.jsonl"):
+        self.destinos = {destino.nome: destino for destino in destinos}
+        self.tamanho_lote = tamanho_lote
+        self.intervalo_lote = intervalo_lote
+        self.tamanho_fila = tamanho_fila
+        self.max_concorrencia = max_concorrencia
+        self.max_tentativas = max_tentativas
+        self.arquivo_derramamento = arquivo_derramamento
+
+        self.loop = None
+        self.fila = None
+        self.thread = None
+        self.tarefa = None
+        self.trava_disco = threading.Lock()
+        self.estatisticas = {'entregues': 0, 'derramadas': 0, 'rederramadas': 0, 'falhas': 0}
+
+    # ------------------------------------------------------------------
+    # API usada pelo loop de monitoramento (thread principal)
+    # ------------------------------------------------------------------
+
+    def iniciar(self):
+        """Inicia o loop de entrega em uma thread daemon"""
+        pronto = threading.Event()
+
+        def executar():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            self.fila = asyncio.Queue(maxsize=self.tamanho_fila)
+            self.tarefa = self.loop.create_task(self.processar())
+            pronto.set()
+            self.loop.run_until_complete(self.tarefa)
+            self.loop.close()
+
+        self.thread = threading.Thread(target=executar, name="despachante-notificacoes", daemon=True)
+        self.thread.start()
+        pronto.wait()
+        return self
+
+    def enviar(self, noticias):
+        """Enfileira notícias para entrega (não bloqueia)"""
+        if self.loop is None:
+            raise RuntimeError("Despachante não iniciado; chame iniciar() antes")
+        self.loop.call_soon_threadsafe(self.colocar_na_fila, list(noticias))
+
+    def parar(self, timeout=30):
+        """Entrega o que estiver na fila e encerra o loop"""
+        if self.loop is None:
+            return
+        # put() aguarda espaço na fila, então o sinal de parada nunca se perde
+        asyncio.run_coroutine_threadsafe(self.fila.put(None), self.loop)
+        self.thread.join(timeout)
+        self.loop = None
+        print(f"Despachante encerrado. {self.estatisticas}")
+
+    # ------------------------------------------------------------------
+    # Loop asyncio (thread do despachante)
+    # ------------------------------------------------------------------
+
+    def colocar_na_fila(self, noticias):
+        """Coloca as notícias na fila; o excedente vai para o disco"""
+        for i, noticia in enumerate(noticias):
+            try:
+                self.fila.put_nowait(noticia)
+            except asyncio.QueueFull:
+                self.derramar(noticias[i:], None)
+                break
+
+    async def processar(self):
+        """Forma lotes a partir da fila e dispara as entregas"""
+        semaforo = asyncio.Semaphore(self.max_concorrencia)
+        entregas = set()
+        encerrar = False
+        ultima_drenagem = time.monotonic()
+        drenagem = None
+
+        while not encerrar:
+            lote = []
+            limite = time.monotonic() + self.intervalo_lote
+            while len(lote) < self.tamanho_lote:
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    break
+                try:
+                    noticia = await asyncio.wait_for(self.fila.get(), restante)
+                except asyncio.TimeoutError:
+                    break
+                if noticia is None:
+                    encerrar = True
+                    break
+                lote.append(noticia)
+
+            if lote:
+                await semaforo.acquire()
+                entrega = asyncio.ensure_future(self.entregar_lote(lote, list(self.destinos)))
+                entrega.add_done_callback(lambda _: semaforo.release())
+                entregas.add(entrega)
+                entrega.add_done_callback(entregas.discard)
+
+            # Reenvia o que foi derramado quando a fila está folgada, em uma
+            # tarefa própria para não parar a formação de lotes
+            if (drenagem is None or drenagem.done()) \
+                    and self.fila.qsize() < self.tamanho_fila // 2 \
+                    and time.monotonic() - ultima_drenagem >= self.intervalo_lote:
+                drenagem = asyncio.ensure_future(self.drenar_derramamento())
+                drenagem.add_done_callback(self.registrar_erro_drenagem)
+                ultima_drenagem = time.monotonic()
+
+        pendentes = entregas | ({drenagem} if drenagem is not None else set())
+        if pendentes:
+            await asyncio.gather(*pendentes, return_exceptions=True)
+
+    def registrar_erro_drenagem(self, drenagem):
+        """Uma drenagem com erro é só registrada; o arquivo fica para a próxima"""
+        if not drenagem.cancelled() and drenagem.exception() is not None:
+            print(f"Erro ao drenar {self.arquivo_derramamento}: {drenagem.exception()}")
+
+    async def entregar_lote(self, lote, nomes_destinos, reenvio=False):
+        """Entrega um lote a vários destinos em paralelo (reenvio=True: veio do disco)"""
+        await asyncio.gather(*(
+            self.entregar_com_tentativas(self.destinos[nome], lote, reenvio)
+            for nome in nomes_destinos if nome in self.destinos
+        ))
+
+    async def entregar_com_tentativas(self, destino, lote, reenvio=False):
+        """Entrega com backoff exponencial; derrama em disco se esgotar as tentativas"""
+        for tentativa in range(1, self.max_tentativas + 1):
+            try:
+                await asyncio.to_thread(destino.entregar, lote)
+                self.estatisticas['entregues'] += len(lote)
+                return True
+            except Exception as e:
+                self.estatisticas['falhas'] += 1
+                if tentativa == self.max_tentativas:
+                    print(f"Erro ao entregar {len(lote)} notícias para {destino.nome}: {e}")
+                    break
+                await asyncio.sleep(min(2 ** (tentativa - 1), 30))
+
+        self.derramar(lote, [destino.nome], reenvio)
+        return False
+
+    def derramar(self, noticias, nomes_destinos, reenvio=False):
+        """
+        Grava um lote no disco (destinos None = todos)
+
+        Um lote que falha de novo na drenagem volta ao arquivo, mas conta em
+        'rederramadas': 'derramadas' registra cada notícia uma vez só.
+        """
+        registro = json.dumps({'destinos': nomes_destinos, 'noticias': noticias}, ensure_ascii=False)
+        with self.trava_disco, open(self.arquivo_derramamento, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(registro + "\n")
+        self.estatisticas['rederramadas' if reenvio else 'derramadas'] += len(noticias)
+
+    async def drenar_derramamento(self):
+        """
+        Reenvia os lotes derramados em disco
+
+        O arquivo é renomeado para `.drenando` antes do reenvio. Se um
+        `.drenando` anterior ficou para trás (queda no meio da drenagem), ele
+        é retomado e o derramamento atual é acrescentado ao fim dele, nunca
+        sobrescrito. Linhas corrompidas (escrita interrompida) são ignoradas.
+        """
+        drenando = self.arquivo_derramamento + ".drenando"
+        with self.trava_disco:
+            if os.path.exists(self.arquivo_derramamento):
+                if os.path.exists(drenando):
+                    with open(self.arquivo_derramamento, 'rb') as origem, open(drenando, 'ab+') as destino:
+                        # Uma última linha rasgada não pode engolir o primeiro registro acrescentado
+                        destino.seek(0, os.SEEK_END)
+                        if destino.tell() > 0:
+                            destino.seek(-1, os.SEEK_END)
+                            if destino.read(1) != b"\n":
+                                destino.write(b"\n")
+                        destino.write(origem.read())
+                    os.remove(self.arquivo_derramamento)
+                else:
+                    os.replace(self.arquivo_derramamento, drenando)
+            elif not os.path.exists(drenando):
+                return
+
+        with open(drenando, 'r', encoding='utf-8') as arquivo:
+            for numero, linha in enumerate(arquivo, 1):
+                try:
+                    registro = json.loads(linha)
+                    nomes = registro['destinos'] or list(self.destinos)
+                    noticias = registro['noticias']
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"Linha {numero} de {drenando} ignorada (corrompida): {e}")
+                    continue
+                for inicio in range(0, len(noticias), self.tamanho_lote):
+                    await self.entregar_lote(noticias[inicio:inicio + self.tamanho_lote], nomes, reenvio=True)
+        os.remove(drenando)
+
+
+# ----------------------------------------------------------------------
+# Receptor HTTP local, para testes e demonstração
+# ----------------------------------------------------------------------
+
+class ReceptorHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        tamanho = int(self.headers.get('Content-Length', 0))
+        dados = json.loads(self.rfile.read(tamanho))
+        self.server.recebidas.extend(dados.get('noticias', []))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, formato, *args):
+        pass
+
+def iniciar_receptor_local(porta=0):
+    """
+    Sobe um servidor HTTP local que guarda as notícias recebidas
+
+    Returns:
+        ThreadingHTTPServer: Servidor com `recebidas` (lista) e `server_port`
+    """
+    servidor = ThreadingHTTPServer(("127.0.0.1", porta), ReceptorHandler)
+    servidor.recebidas = []
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+def main():
+    """Demonstração: envia notícias do feed para um receptor local"""
+    from bs4_g1rss_monitoramento import G1RSScraper
+
+    receptor = iniciar_receptor_local()
+    despachante = DespachanteNotificacoes(
+        [DestinoWebhook(f"http://127.0.0.1:{receptor.server_port}/")],
+        tamanho_lote=10, intervalo_lote=1,
+    ).iniciar()
+
+    scraper = G1RSScraper()
+    if scraper.executar_raspagem(salvar_arquivos=False, exibir=False):
+        despachante.enviar(scraper.noticias)
+
+    despachante.parar()
+    print(f"Notícias recebidas pelo receptor: {len(receptor.recebidas)}")
+    receptor.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import cProfile
+import gc
+import io
+import os
+import pstats
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    from pyinstrument import Profiler as ProfilerAmostragem
+except ImportError:
+    ProfilerAmostragem = None
+
+def obter_rss_mb():
+    """Memória residente (RSS) atual do processo, em MB"""
+    try:
+        # Linux: segunda coluna de /proc/self/statm é o RSS em páginas
+        with open("/proc/self/statm", 'r') as arquivo:
+            paginas = int(arquivo.read().split()[1])
+        return paginas * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        # Outros sistemas: pico de RSS (KB no Linux, bytes no macOS)
+        import resource
+        maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maximo / 1024 ** 2 if sys.platform == "darwin" else maximo / 1024
+
+class PerfiladorCiclos:
+    """Perfilamento opcional de cada ciclo do `monitorar_noticias`.
+
+    Para cada ciclo pode gravar, no diretório de saída:
+        - ciclo_NNNN.prof / ciclo_NNNN.txt: perfil de CPU (cProfile ou pyinstrument)
+        - memoria_NNNN.txt: diferença do tracemalloc em relação ao ciclo anterior
+    e verifica limites de RSS e de crescimento, emitindo alertas ou
+    reiniciando o processo de forma limpa.
+    """
+
+    def __init__(self, diretorio="perfil_monitoramento", cpu=None, memoria=False,
+                 limite_rss_mb=None, limite_crescimento_mb=None, acao_limite='alertar',
+                 top=25):
+        """
+        Args:
+            diretorio (str): Onde gravar os relatórios
+            cpu (str): None, 'cprofile' ou 'amostragem' (requer pyinstrument)
+            memoria (bool): Ativa snapshots do tracemalloc entre ciclos
+            limite_rss_mb (float): RSS máximo antes de agir
+            limite_crescimento_mb (float): Crescimento de RSS desde o 1º ciclo antes de agir
+            acao_limite (str): 'alertar' ou 'reiniciar'
+            top (int): Linhas por relatório
+        """
+        if cpu not in (None, 'cprofile', 'amostragem'):
+            raise ValueError(f"Modo de CPU inválido: {cpu}")
+        if cpu == 'amostragem' and ProfilerAmostragem is None:
+            raise ImportError("O modo 'amostragem' requer o pacote pyinstrument")
+        if acao_limite not in ('alertar', 'reiniciar'):
+            raise ValueError(f"Ação inválida: {acao_limite}")
+
+        self.diretorio = diretorio
+        self.cpu = cpu
+        self.memoria = memoria
+        self.limite_rss_mb = limite_rss_mb
+        self.limite_crescimento_mb = limite_crescimento_mb
+        self.acao_limite = acao_limite
+        self.top = top
+
+        self.numero_ciclo = 0
+        self.rss_inicial = None
+        self.snapshot_anterior = None
+
+        os.makedirs(self.diretorio, exist_ok=True)
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+
+    def caminho(self, nome):
+        return os.path.join(self.diretorio, nome)
+
+    @contextmanager
+    def ciclo(self):
+        """Envolve o trabalho de um ciclo (sem o sleep)"""
+        self.numero_ciclo += 1
+        profiler = None
+        if self.cpu == 'cprofile':
+            profiler = cProfile.Profile()
+            profiler.enable()
+        elif self.cpu == 'amostragem':
+            profiler = ProfilerAmostragem()
+            profiler.start()
+
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                self.gravar_perfil_cpu(profiler)
+            if self.memoria:
+                self.gravar_diff_memoria()
+            self.registrar_rss()
+
+    def gravar_perfil_cpu(self, profiler):
+        """Grava o perfil de CPU do ciclo"""
+        base = f"ciclo_{self.numero_ciclo:04d}"
+        if self.cpu == 'cprofile':
+            profiler.disable()
+            profiler.dump_stats(self.caminho(base + ".prof"))
+            saida = io.StringIO()
+            pstats.Stats(profiler, stream=saida).sort_stats('cumulative').print_stats(self.top)
+            texto = saida.getvalue()
+        else:
+            profiler.stop()
+            texto = profiler.output_text()
+
+        with open(self.caminho(base + ".txt"), 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto)
+
+    def gravar_diff_memoria(self):
+        """Compara o snapshot do tracemalloc com o do ciclo anterior"""
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+        linhas = [f"Ciclo {self.numero_ciclo} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"]
+        atual, pico = tracemalloc.get_traced_memory()
+        linhas.append(f"Memória rastreada: {atual / 1024 ** 2:.2f} MB (pico {pico / 1024 ** 2:.2f} MB)\n")
+
+        if self.snapshot_anterior is None:
+            linhas.append("Maiores alocações:")
+            estatisticas = snapshot.statistics('lineno')
+        else:
+            linhas.append("Maior crescimento desde o ciclo anterior:")
+            estatisticas = snapshot.compare_to(self.snapshot_anterior, 'lineno')
+        linhas.extend(str(estatistica) for estatistica in estatisticas[:self.top])
+
+        with open(self.caminho(f"memoria_{self.numero_ciclo:04d}.txt"), 'w', encoding='utf-8') as arquivo:
+            arquivo.write("\n".join(linhas) + "\n")
+
+        self.snapshot_anterior = snapshot
+
+    def registrar_rss(self):
+        """Acrescenta o RSS do ciclo ao histórico (rss.csv)"""
+        rss = obter_rss_mb()
+        if self.rss_inicial is None:
+            self.rss_inicial = rss
+
+        caminho = self.caminho("rss.csv")
+        novo = not os.path.exists(caminho)
+        with open(caminho, 'a', encoding='utf-8') as arquivo:
+            if novo:
+                arquivo.write("ciclo,data,rss_mb\n")
+            arquivo.write(f"{self.numero_ciclo},{datetime.now().strftime('%Y-%m-%d %H:%M:%S')},{rss:.1f}\n")
+
+    def limite_excedido(self):
+        """
+        Verifica os limites de memória
+
+        Returns:
+            str: Motivo, ou None se estiver dentro dos limites
+        """
+        rss = obter_rss_mb()
+        if self.limite_rss_mb is not None and rss > self.limite_rss_mb:
+            return f"RSS de {rss:.1f} MB acima do limite de {self.limite_rss_mb} MB"
+        if (self.limite_crescimento_mb is not None and self.rss_inicial is not None
+                and rss - self.rss_inicial > self.limite_crescimento_mb):
+            return (f"RSS cresceu {rss - self.rss_inicial:.1f} MB desde o primeiro ciclo "
+                    f"(limite {self.limite_crescimento_mb} MB)")
+        return None
+
+    def verificar_memoria(self, ao_reiniciar=None):
+        """
+        Alerta ou reinicia o processo se algum limite de memória foi excedido
+
+        Args:
+            ao_reiniciar (callable): Chamada antes do reinício, para encerrar de
+                forma limpa o que o exec descartaria (filas, conexões)
+        """
+        motivo = self.limite_excedido()
+        if motivo is None:
+            return
+
+        print(f"ALERTA DE MEMÓRIA: {motivo}")
+        with open(self.caminho("alertas.log"), 'a', encoding='utf-8') as arquivo:
+            arquivo.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {motivo}\n")
+
+        if self.acao_limite == 'reiniciar':
+            if ao_reiniciar is not None:
+                ao_reiniciar()
+            self.reiniciar_processo()
+
+    def reiniciar_processo(self):
+        """Substitui o processo atual por uma nova execução com os mesmos argumentos"""
+        print("Reiniciando o processo...")
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # orig_argv preserva as opções do interpretador (-X, -m, -W...);
+        # sys.argv só tem o script e os argumentos dele
+        argumentos = getattr(sys, 'orig_argv', None) or [sys.executable] + sys.argv
+        os.execv(sys.executable, argumentos)
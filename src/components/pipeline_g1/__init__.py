@@ -0,0 +1,26 @@
+"""
+PIPELINE DE RASPAGEM EM STREAMING
+Etapas componíveis (buscar → parsear → extrair → enriquecer → gravar) ligadas
+por geradores: cada notícia flui até os destinos assim que é parseada, e a
+memória fica limitada pelo tamanho do lote, não pelo tamanho do feed.
+
+Exemplo:
+    from pipeline_g1 import executar_pipeline, DestinoCSV, DestinoJSON
+
+    executar_pipeline(
+        ["https://g1.globo.com/rss/g1/brasil/"],
+        [DestinoCSV("noticias.csv"), DestinoJSON("noticias.json")],
+    )
+"""
+
+from .etapas import (
+    HEADERS_PADRAO,
+    buscar,
+    parsear,
+    formatar_data,
+    enriquecer,
+    em_lotes,
+)
+from .formatos import detectar_formato, normalizar_feed
+from .destinos import DestinoCSV, DestinoJSON, DestinoSQLite, CAMPOS
+from .executor import executar_pipeline, noticias_de
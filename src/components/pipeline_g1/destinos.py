@@ -0,0 +1,70 @@
+import csv
+import json
+import os
+import sqlite3
+
+CAMPOS = ['titulo', 'link', 'descricao', 'categoria', 'data_publicacao',
+          'data_formatada', 'data_raspagem', 'guid']
+
+class DestinoCSV:
+    """Etapa 5: grava lotes de notícias em CSV (mesmo formato de `salvar_csv`)"""
+
+    def __init__(self, nome_arquivo="noticias_g1_brasil.csv", acrescentar=False):
+        novo = not (acrescentar and os.path.exists(nome_arquivo))
+        self.arquivo = open(nome_arquivo, 'a' if acrescentar else 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.arquivo, fieldnames=CAMPOS, extrasaction='ignore')
+        if novo:
+            self.writer.writeheader()
+
+    def gravar_lote(self, lote):
+        self.writer.writerows(lote)
+        self.arquivo.flush()
+
+    def fechar(self):
+        self.arquivo.close()
+
+class DestinoJSON:
+    """Etapa 5: grava as notícias como um array JSON, item a item"""
+
+    def __init__(self, nome_arquivo="noticias_g1_brasil.json"):
+        self.arquivo = open(nome_arquivo, 'w', encoding='utf-8')
+        self.arquivo.write("[")
+        self.primeiro = True
+
+    def gravar_lote(self, lote):
+        for noticia in lote:
+            self.arquivo.write("\n  " if self.primeiro else ",\n  ")
+            json.dump(noticia, self.arquivo, ensure_ascii=False)
+            self.primeiro = False
+        self.arquivo.flush()
+
+    def fechar(self):
+        self.arquivo.write("\n]\n" if not self.primeiro else "]\n")
+        self.arquivo.close()
+
+class DestinoSQLite:
+    """Etapa 5: grava as notícias no SQLite (upsert por GUID)"""
+
+    def __init__(self, caminho_db="noticias_g1.db"):
+        self.conexao = sqlite3.connect(caminho_db)
+        self.conexao.execute(f"""
+            CREATE TABLE IF NOT EXISTS noticias (
+                guid TEXT PRIMARY KEY, {', '.join(c + ' TEXT' for c in CAMPOS if c != 'guid')}
+            )
+        """)
+
+    def gravar_lote(self, lote):
+        # Sem GUID (opcional no RSS) a chave é o link, senão os itens
+        # colidiriam todos na linha "N/A"
+        with self.conexao:
+            self.conexao.executemany(
+                f"INSERT OR REPLACE INTO noticias ({', '.join(CAMPOS)}) "
+                f"VALUES ({', '.join(':' + c for c in CAMPOS)})",
+                (
+                    noticia if noticia.get('guid', "N/A") != "N/A" else dict(noticia, guid=noticia['link'])
+                    for noticia in lote
+                ),
+            )
+
+    def fechar(self):
+        self.conexao.close()
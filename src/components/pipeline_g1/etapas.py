@@ -0,0 +1,104 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from itertools import chain, islice
+
+HEADERS_PADRAO = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+TAMANHO_PEDACO = 64 * 1024
+
+def buscar(url, headers=None, timeout=10, cache=None):
+    """
+    Etapa 1: baixa o feed em pedaços de bytes
+
+    Args:
+        url (str): URL do feed
+        headers (dict): Headers da requisição
+        timeout (float): Timeout em segundos
+        cache (CacheHTTP): Cache opcional; neste caso o corpo vem de uma vez
+
+    Yields:
+        bytes: Pedaços do corpo da resposta
+
+    Raises:
+        requests.exceptions.RequestException: Em erros de rede/HTTP
+    """
+    headers = headers or HEADERS_PADRAO
+
+    if cache is not None:
+        yield cache.obter(url, headers=headers, timeout=timeout).encode('utf-8')
+        return
+
+    # Importado aqui para que quem só usa os destinos não pague pelo requests
+    import requests
+
+    with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        yield from response.iter_content(TAMANHO_PEDACO)
+
+def parsear(pedacos, tag='item'):
+    """
+    Etapa 2: parseia o XML incrementalmente e emite cada <item> completo
+
+    Depois que o consumidor processa o elemento, ele é removido do pai
+    (<channel> ou a raiz); só limpá-lo deixaria os itens vazios pendurados
+    na árvore, que cresceria com o tamanho do feed.
+
+    Args:
+        pedacos (iterable): Pedaços de bytes do XML
+        tag (str): Tag dos elementos a emitir
+
+    Yields:
+        Element: Elemento <item>
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    abertos = []  # Elementos ainda não fechados: o último é o pai do atual
+    for pedaco in chain(pedacos, [None]):
+        if pedaco is None:
+            parser.close()
+        else:
+            parser.feed(pedaco)
+        for evento, elemento in parser.read_events():
+            if evento == 'start':
+                abertos.append(elemento)
+                continue
+            abertos.pop()
+            if elemento.tag == tag:
+                yield elemento
+                if abertos:
+                    abertos[-1].remove(elemento)
+                elemento.clear()
+
+def formatar_data(data_rss):
+    """Converte a data do RSS para formato mais legível"""
+    try:
+        # Formato típico do RSS: "Wed, 08 Aug 2025 10:30:00 -0300"
+        data_obj = datetime.strptime(data_rss[:25], "%a, %d %b %Y %H:%M:%S")
+        return data_obj.strftime("%d/%m/%Y %H:%M:%S")
+    except (TypeError, ValueError):
+        return data_rss
+
+def enriquecer(noticias, *funcoes):
+    """
+    Etapa 4: aplica funções de enriquecimento a cada notícia
+
+    Cada função recebe o dicionário e devolve o dicionário (possivelmente
+    alterado) ou None para descartar a notícia.
+    """
+    for noticia in noticias:
+        for funcao in funcoes:
+            noticia = funcao(noticia)
+            if noticia is None:
+                break
+        else:
+            yield noticia
+
+def em_lotes(iteravel, tamanho):
+    """Agrupa um iterável em listas de até `tamanho` elementos"""
+    iterador = iter(iteravel)
+    while True:
+        lote = list(islice(iterador, tamanho))
+        if not lote:
+            return
+        yield lote
@@ -0,0 +1,55 @@
+from .etapas import buscar, enriquecer, em_lotes
+from .formatos import normalizar_feed
+
+def noticias_de(url, enriquecedores=(), headers=None, cache=None):
+    """
+    Encadeia buscar → parsear/extrair → enriquecer para um feed
+
+    O formato (RSS, Atom ou RDF) é detectado pelos primeiros bytes.
+
+    Yields:
+        dict: Notícias, uma por vez, à medida que são parseadas
+    """
+    pedacos = buscar(url, headers=headers, cache=cache)
+    return enriquecer(normalizar_feed(pedacos), *enriquecedores)
+
+def executar_pipeline(urls, destinos, tamanho_lote=100, enriquecedores=(), headers=None, cache=None):
+    """
+    Executa o pipeline completo para vários feeds
+
+    Os destinos recebem lotes de até `tamanho_lote` notícias; o próximo lote
+    só é parseado depois que o anterior foi gravado (backpressure natural
+    dos geradores).
+
+    Args:
+        urls (list): URLs dos feeds RSS
+        destinos (list): Objetos com `gravar_lote(lote)` e `fechar()`
+        tamanho_lote (int): Quantidade de notícias por lote
+        enriquecedores (tuple): Funções aplicadas a cada notícia
+        headers (dict): Headers das requisições
+        cache (CacheHTTP): Cache HTTP opcional
+
+    Returns:
+        int: Total de notícias gravadas
+    """
+    import requests
+
+    total = 0
+    try:
+        for url in urls:
+            try:
+                noticias = noticias_de(url, enriquecedores, headers=headers, cache=cache)
+                for lote in em_lotes(noticias, tamanho_lote):
+                    for destino in destinos:
+                        destino.gravar_lote(lote)
+                    total += len(lote)
+            except requests.exceptions.RequestException as e:
+                print(f"Erro ao fazer requisição ({url}): {e}")
+            except Exception as e:
+                print(f"Erro ao processar o feed {url}: {e}")
+    finally:
+        for destino in destinos:
+            destino.fechar()
+
+    print(f"Total de notícias gravadas: {total}")
+    return total
@@ -0,0 +1,191 @@
+import re
+from datetime import datetime
+from email.utils import format_datetime
+from itertools import chain
+
+from .etapas import formatar_data, parsear
+
+# Nomes qualificados ({namespace}tag), comparados direto com elemento.tag
+ATOM = "{http://www.w3.org/2005/Atom}"
+RSS1 = "{http://purl.org/rss/1.0/}"
+RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+MEDIA = "{http://search.yahoo.com/mrss/}"
+
+BYTES_DETECCAO = 1024
+
+PADRAO_PROLOGO = re.compile(
+    r"^(?:\ufeff|\xef\xbb\xbf|\s+|<\?.*?\?>|<!--.*?-->|<!DOCTYPE[^>]*>)*<([\w:.-]+)([^>]*)",
+    re.DOTALL,
+)
+
+def detectar_formato(inicio):
+    """
+    Detecta o formato do feed olhando só os primeiros bytes
+
+    Pula o prólogo (declaração XML, comentários, DOCTYPE) e inspeciona o
+    elemento raiz, sem parsear o documento.
+
+    Args:
+        inicio (bytes | str): Início do documento
+
+    Returns:
+        str: 'rss', 'atom', 'rdf' ou 'desconhecido'
+    """
+    if isinstance(inicio, bytes):
+        # latin-1 nunca falha e preserva os caracteres ASCII das tags
+        inicio = inicio[:BYTES_DETECCAO].decode('latin-1')
+
+    encontrado = PADRAO_PROLOGO.match(inicio[:BYTES_DETECCAO])
+    if not encontrado:
+        return 'desconhecido'
+
+    raiz, atributos = encontrado.groups()
+    local = raiz.rsplit(":", 1)[-1]
+    if local == 'rss':
+        return 'rss'
+    if local == 'feed' and "http://www.w3.org/2005/Atom" in atributos:
+        return 'atom'
+    if local == 'RDF':
+        return 'rdf'
+    return 'desconhecido'
+
+def data_para_rfc822(valor):
+    """Converte datas ISO 8601 (Atom/RDF) para o formato do pubDate do RSS"""
+    try:
+        return format_datetime(datetime.fromisoformat(valor.strip()))
+    except (AttributeError, ValueError):
+        return valor
+
+def registro_vazio():
+    return {
+        'titulo': "N/A",
+        'link': "N/A",
+        'descricao': "N/A",
+        'data_publicacao': "N/A",
+        'categoria': "N/A",
+        'guid': "N/A",
+        'imagem': "N/A",
+    }
+
+def finalizar(registro):
+    """Completa os campos derivados comuns a todos os formatos"""
+    data = registro['data_publicacao']
+    registro['data_formatada'] = formatar_data(data) if data != "N/A" else "N/A"
+    registro['data_raspagem'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return registro
+
+def extrair_rss(item):
+    """Mapeia um <item> RSS 2.0 (com extensões dc/media) em uma única passada"""
+    registro = registro_vazio()
+    for filho in item:
+        tag = filho.tag
+        if tag == 'title':
+            registro['titulo'] = filho.text
+        elif tag == 'link':
+            registro['link'] = filho.text
+        elif tag == 'description':
+            registro['descricao'] = filho.text
+        elif tag == 'pubDate':
+            registro['data_publicacao'] = filho.text
+        elif tag == 'category' and registro['categoria'] == "N/A":
+            registro['categoria'] = filho.text
+        elif tag == 'guid':
+            registro['guid'] = filho.text
+        elif tag == DC + 'date' and registro['data_publicacao'] == "N/A":
+            registro['data_publicacao'] = data_para_rfc822(filho.text)
+        elif tag in (MEDIA + 'content', MEDIA + 'thumbnail') and registro['imagem'] == "N/A":
+            registro['imagem'] = filho.get('url', "N/A")
+    return finalizar(registro)
+
+def extrair_atom(entrada):
+    """Mapeia uma <entry> Atom no mesmo registro do RSS"""
+    registro = registro_vazio()
+    atualizado = None
+    for filho in entrada:
+        tag = filho.tag
+        if tag == ATOM + 'title':
+            registro['titulo'] = filho.text
+        elif tag == ATOM + 'link':
+            if filho.get('rel', 'alternate') == 'alternate' and registro['link'] == "N/A":
+                registro['link'] = filho.get('href', "N/A")
+            elif filho.get('rel') == 'enclosure' and filho.get('type', '').startswith('image/'):
+                registro['imagem'] = filho.get('href', "N/A")
+        elif tag == ATOM + 'summary' or (tag == ATOM + 'content' and registro['descricao'] == "N/A"):
+            registro['descricao'] = filho.text
+        elif tag == ATOM + 'published':
+            registro['data_publicacao'] = data_para_rfc822(filho.text)
+        elif tag == ATOM + 'updated':
+            atualizado = filho.text
+        elif tag == ATOM + 'category' and registro['categoria'] == "N/A":
+            registro['categoria'] = filho.get('term', "N/A")
+        elif tag == ATOM + 'id':
+            registro['guid'] = filho.text
+        elif tag in (MEDIA + 'content', MEDIA + 'thumbnail') and registro['imagem'] == "N/A":
+            registro['imagem'] = filho.get('url', "N/A")
+
+    if registro['data_publicacao'] == "N/A" and atualizado:
+        registro['data_publicacao'] = data_para_rfc822(atualizado)
+    return finalizar(registro)
+
+def extrair_rdf(item):
+    """Mapeia um <item> RSS 1.0 (RDF) no mesmo registro do RSS"""
+    registro = registro_vazio()
+    registro['guid'] = item.get(RDF + 'about', "N/A")
+    for filho in item:
+        tag = filho.tag
+        if tag == RSS1 + 'title':
+            registro['titulo'] = filho.text
+        elif tag == RSS1 + 'link':
+            registro['link'] = filho.text
+        elif tag == RSS1 + 'description':
+            registro['descricao'] = filho.text
+        elif tag == DC + 'date':
+            registro['data_publicacao'] = data_para_rfc822(filho.text)
+        elif tag == DC + 'subject' and registro['categoria'] == "N/A":
+            registro['categoria'] = filho.text
+        elif tag in (MEDIA + 'content', MEDIA + 'thumbnail') and registro['imagem'] == "N/A":
+            registro['imagem'] = filho.get('url', "N/A")
+    return finalizar(registro)
+
+FORMATOS = {
+    'rss': ('item', extrair_rss),
+    'atom': (ATOM + 'entry', extrair_atom),
+    'rdf': (RSS1 + 'item', extrair_rdf),
+}
+
+def normalizar_feed(pedacos):
+    """
+    Detecta o formato e emite as notícias normalizadas, em streaming
+
+    Args:
+        pedacos (iterable): Pedaços do documento (bytes ou str)
+
+    Yields:
+        dict: Notícia com os mesmos campos para RSS, Atom e RDF
+
+    Raises:
+        ValueError: Se o formato não for reconhecido
+        xml.etree.ElementTree.ParseError: Se o XML for inválido
+    """
+    pedacos = iter(pedacos)
+
+    # Acumula o suficiente para a detecção (o primeiro pedaço pode ser pequeno)
+    inicio = []
+    tamanho = 0
+    for pedaco in pedacos:
+        inicio.append(pedaco)
+        tamanho += len(pedaco)
+        if tamanho >= BYTES_DETECCAO:
+            break
+    if not inicio:
+        return
+
+    vazio = b"" if isinstance(inicio[0], bytes) else ""
+    formato = detectar_formato(vazio.join(inicio))
+    if formato not in FORMATOS:
+        raise ValueError("Formato de feed não reconhecido (esperado RSS, Atom ou RDF)")
+    tag_item, extrator = FORMATOS[formato]
+
+    for elemento in parsear(chain(inicio, pedacos), tag_item):
+        yield extrator(elemento)
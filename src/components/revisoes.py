@@ -0,0 +1,147 @@
+import json
+import re
+import sqlite3
+import unicodedata
+import zlib
+from datetime import datetime
+
+CAMPOS_CONTEUDO = ('titulo', 'descricao', 'link', 'categoria')
+
+NOVA = 'nova'
+REVISADA = 'revisada'
+INALTERADA = 'inalterada'
+
+def normalizar(valor):
+    """Normaliza um campo para comparação (Unicode NFC, espaços colapsados)"""
+    if valor is None:
+        return ""
+    return re.sub(r"\s+", " ", unicodedata.normalize('NFC', valor)).strip()
+
+def calcular_hash(noticia):
+    """
+    Impressão digital do conteúdo de uma notícia
+
+    Usa CRC32 (rápido e não criptográfico). Como só comparamos hashes do
+    mesmo GUID, 32 bits bastam para detectar edições.
+
+    Returns:
+        int: Hash dos campos normalizados
+    """
+    conteudo = "\x1f".join(normalizar(noticia.get(campo)) for campo in CAMPOS_CONTEUDO)
+    return zlib.crc32(conteudo.encode('utf-8'))
+
+class RegistroRevisoes:
+    """Guarda o hash de cada GUID e o histórico de edições das notícias.
+
+    A cada nova leitura do feed, `classificar` diz se cada notícia é nova,
+    revisada ou inalterada. Para revisões, só os campos alterados são
+    gravados (antes/depois) na tabela `revisoes`.
+    """
+
+    def __init__(self, caminho_db="revisoes_g1.db"):
+        self.conexao = sqlite3.connect(caminho_db)
+        self.conexao.executescript("""
+            CREATE TABLE IF NOT EXISTS versoes_atuais (
+                guid TEXT PRIMARY KEY,
+                hash INTEGER NOT NULL,
+                versao INTEGER NOT NULL,
+                campos TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS revisoes (
+                guid TEXT NOT NULL,
+                versao INTEGER NOT NULL,
+                diff TEXT NOT NULL,
+                detectado_em TEXT NOT NULL,
+                PRIMARY KEY (guid, versao)
+            );
+        """)
+        # Só os hashes ficam em memória; os campos são lidos apenas nas revisões
+        self.hashes = dict(self.conexao.execute("SELECT guid, hash FROM versoes_atuais"))
+
+    def chave(self, noticia):
+        """GUID da notícia (ou o link, quando o feed não tem GUID)"""
+        guid = noticia.get('guid', "N/A")
+        return guid if guid != "N/A" else noticia.get('link', "N/A")
+
+    def calcular_diff(self, guid, noticia, pendentes):
+        """Compara com a versão gravada; retorna (versão anterior, diff)"""
+        if guid in pendentes:
+            # GUID repetido no mesmo lote, ainda não gravado
+            _, versao, campos = pendentes[guid]
+        else:
+            versao, campos = self.conexao.execute(
+                "SELECT versao, campos FROM versoes_atuais WHERE guid = ?", (guid,)
+            ).fetchone()
+        anteriores = json.loads(campos)
+        diff = {
+            campo: [anteriores.get(campo), noticia.get(campo)]
+            for campo in CAMPOS_CONTEUDO
+            if normalizar(anteriores.get(campo)) != normalizar(noticia.get(campo))
+        }
+        return versao, diff
+
+    def classificar(self, noticias):
+        """
+        Classifica as notícias e atualiza o registro em uma única transação
+
+        Args:
+            noticias (list): Lista de dicionários de notícias
+
+        Returns:
+            list: Estado de cada notícia ('nova', 'revisada' ou 'inalterada'),
+                na mesma ordem da entrada
+        """
+        agora = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        estados = []
+        atuais = {}
+        revisoes = []
+
+        for noticia in noticias:
+            guid = self.chave(noticia)
+            hash_atual = calcular_hash(noticia)
+            hash_anterior = self.hashes.get(guid)
+
+            if hash_anterior == hash_atual:
+                estados.append(INALTERADA)
+                continue
+
+            campos = json.dumps({campo: noticia.get(campo) for campo in CAMPOS_CONTEUDO},
+                                ensure_ascii=False)
+            if hash_anterior is None:
+                estados.append(NOVA)
+                atuais[guid] = (hash_atual, 1, campos)
+            else:
+                versao, diff = self.calcular_diff(guid, noticia, atuais)
+                estados.append(REVISADA)
+                atuais[guid] = (hash_atual, versao + 1, campos)
+                revisoes.append((guid, versao + 1, json.dumps(diff, ensure_ascii=False), agora))
+
+            self.hashes[guid] = hash_atual
+
+        if atuais:
+            with self.conexao:
+                self.conexao.executemany(
+                    "INSERT OR REPLACE INTO versoes_atuais (guid, hash, versao, campos) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(guid, *valores) for guid, valores in atuais.items()],
+                )
+                self.conexao.executemany(
+                    "INSERT OR REPLACE INTO revisoes (guid, versao, diff, detectado_em) "
+                    "VALUES (?, ?, ?, ?)",
+                    revisoes,
+                )
+
+        return estados
+
+    def historico(self, guid):
+        """Lista as revisões de um GUID: [(versao, diff, detectado_em), ...]"""
+        return [
+            (versao, json.loads(diff), detectado_em)
+            for versao, diff, detectado_em in self.conexao.execute(
+                "SELECT versao, diff, detectado_em FROM revisoes WHERE guid = ? ORDER BY versao",
+                (guid,),
+            )
+        ]
+
+    def fechar(self):
+        self.conexao.close()
@@ -11,6 +11,8 @@ import json
 from datetime import datetime
 import os
 
+from inspecao_arquivos import contar_registros_csv, ler_cabeca_csv
+
 def fazer_requisicao(url):
     """Faz requisição HTTP (dos scripts anteriores)"""
     try:
@@ -151,10 +153,9 @@ def verificar_arquivos_criados():
             print(f"✅ {arquivo}")
             print(f"   📏 Tamanho: {tamanho:,} bytes")
             
-            # Para CSV, contar linhas
+            # Para CSV, contar linhas (varrendo os bytes, sem carregar o arquivo)
             if arquivo.endswith('.csv'):
-                with open(arquivo, 'r', encoding='utf-8') as f:
-                    linhas = len(f.readlines())
+                linhas = contar_registros_csv(arquivo)
                 print(f"   📊 Linhas: {linhas} (incluindo cabeçalho)")
         else:
             print(f"❌ {arquivo} - Não encontrado")
@@ -172,26 +173,21 @@ def exibir_preview_csv(nome_arquivo="noticias_g1.csv", linhas=5):
         print(f"👀 PREVIEW DO CSV (primeiras {linhas} linhas)")
         print("=" * 60)
         
-        with open(nome_arquivo, 'r', encoding='utf-8') as arquivo:
-            reader = csv.reader(arquivo)
-            
-            for i, linha in enumerate(reader):
-                if i == 0:
-                    # Cabeçalho
-                    print("CABEÇALHO:")
-                    print(" | ".join(linha))
-                    print("-" * 60)
-                elif i <= linhas:
-                    # Dados
-                    print(f"Linha {i}:")
-                    for j, valor in enumerate(linha):
-                        coluna = linha[0] if i == 0 else reader.fieldnames[j] if hasattr(reader, 'fieldnames') else f"Col{j}"
-                        # Truncar valores muito longos
-                        valor_truncado = valor[:50] + "..." if len(valor) > 50 else valor
-                        print(f"  {j+1}. {valor_truncado}")
-                    print("-" * 40)
-                else:
-                    break
+        cabecalho, dados = ler_cabeca_csv(nome_arquivo, linhas)
+        
+        # Cabeçalho
+        print("CABEÇALHO:")
+        print(" | ".join(cabecalho))
+        print("-" * 60)
+        
+        # Dados
+        for i, linha in enumerate(dados, 1):
+            print(f"Linha {i}:")
+            for j, valor in enumerate(linha):
+                # Truncar valores muito longos
+                valor_truncado = valor[:50] + "..." if len(valor) > 50 else valor
+                print(f"  {j+1}. {valor_truncado}")
+            print("-" * 40)
                     
     except Exception as e:
         print(f"❌ Erro ao ler CSV: {e}")
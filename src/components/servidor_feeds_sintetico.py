@@ -0,0 +1,261 @@
+"""
+SERVIDOR DE FEEDS RSS SINTÉTICOS
+Objetivo: Simular centenas de feeds localmente para testar o scraper e o
+monitoramento sob carga, sem depender do G1
+
+Cada feed fica em /feed/<n> e ganha notícias novas com o tempo. É possível
+configurar o número de feeds e de itens, o tamanho das descrições, a taxa
+de atualização, a latência, a injeção de erros e o suporte a 304.
+
+Uso:
+    python servidor_feeds_sintetico.py --feeds 200 --itens 50 --latencia-ms 80 --taxa-erros 0.02
+"""
+
+import argparse
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+CATEGORIAS = ["Política", "Economia", "Brasil", "Saúde", "Educação", "Esportes"]
+PALAVRAS = ["governo", "chuva", "eleição", "vacina", "mercado", "escola", "polícia",
+            "estado", "cidade", "projeto", "ministério", "justiça"]
+
+class ConfiguracaoFeeds:
+    """Parâmetros dos feeds gerados e das falhas simuladas"""
+
+    def __init__(self, n_feeds=100, itens_por_feed=30, tamanho_descricao=40,
+                 novos_por_minuto=2.0, latencia_ms=0, variacao_latencia_ms=0,
+                 taxa_erros=0.0, taxa_xml_invalido=0.0, suporte_304=True, max_age=0,
+                 semente=42):
+        """
+        Args:
+            n_feeds (int): Quantidade de feeds (/feed/0 ... /feed/N-1)
+            itens_por_feed (int): Itens em cada resposta
+            tamanho_descricao (int): Palavras por descrição (controla o tamanho do corpo)
+            novos_por_minuto (float): Notícias novas por feed por minuto (0 = feed estático)
+            latencia_ms (float): Atraso base de cada resposta
+            variacao_latencia_ms (float): Atraso extra aleatório (exponencial, média dada)
+            taxa_erros (float): Fração das respostas com 503
+            taxa_xml_invalido (float): Fração das respostas com XML truncado
+            suporte_304 (bool): Responde 304 a If-None-Match/If-Modified-Since
+            max_age (int): Valor do Cache-Control max-age
+            semente (int): Semente do gerador aleatório (conteúdo reprodutível)
+        """
+        self.n_feeds = n_feeds
+        self.itens_por_feed = itens_por_feed
+        self.tamanho_descricao = tamanho_descricao
+        self.novos_por_minuto = novos_por_minuto
+        self.latencia_ms = latencia_ms
+        self.variacao_latencia_ms = variacao_latencia_ms
+        self.taxa_erros = taxa_erros
+        self.taxa_xml_invalido = taxa_xml_invalido
+        self.suporte_304 = suporte_304
+        self.max_age = max_age
+        self.semente = semente
+
+class GeradorFeeds:
+    """Gera o XML de cada feed, reaproveitando o corpo enquanto a versão não muda"""
+
+    def __init__(self, configuracao):
+        self.configuracao = configuracao
+        self.inicio = time.time()
+        self.corpos = {}  # feed -> (versao, corpo em bytes)
+        self.trava = threading.Lock()
+
+    def versao(self, feed):
+        """Número de notícias já publicadas no feed (define o conteúdo atual)"""
+        decorrido = time.time() - self.inicio
+        # Defasagem por feed para que nem todos mudem no mesmo instante
+        defasagem = (feed * 7919) % 60
+        return self.configuracao.itens_por_feed + int(
+            (decorrido + defasagem) * self.configuracao.novos_por_minuto / 60
+        )
+
+    def momento_da_versao(self, feed, versao):
+        """Instante (epoch) em que a versão foi publicada, para o Last-Modified"""
+        novos_por_minuto = self.configuracao.novos_por_minuto
+        if not novos_por_minuto:
+            return self.inicio
+        excedente = versao - self.configuracao.itens_por_feed
+        defasagem = (feed * 7919) % 60
+        return self.inicio + max(0.0, excedente * 60 / novos_por_minuto - defasagem)
+
+    def item(self, feed, numero):
+        """XML de um item, determinístico para (feed, número)"""
+        aleatorio = random.Random(self.configuracao.semente * 1_000_003 + feed * 100_003 + numero)
+        titulo = " ".join(aleatorio.choices(PALAVRAS, k=6)).capitalize()
+        descricao = " ".join(aleatorio.choices(PALAVRAS, k=self.configuracao.tamanho_descricao))
+        categoria = aleatorio.choice(CATEGORIAS)
+        data = formatdate(self.inicio - 3600 + numero * 60, usegmt=True)
+        link = f"https://feeds.local/{feed}/noticia/{numero}"
+        return (f"<item><title>{titulo} {numero}</title><link>{link}</link>"
+                f"<description>{descricao}</description><category>{categoria}</category>"
+                f"<pubDate>{data}</pubDate><guid>{link}</guid></item>")
+
+    def corpo(self, feed, versao):
+        """XML completo do feed na versão dada (os mais recentes primeiro)"""
+        with self.trava:
+            guardado = self.corpos.get(feed)
+        if guardado is not None and guardado[0] == versao:
+            return guardado[1]
+
+        itens = "".join(
+            self.item(feed, numero)
+            for numero in range(versao - 1, max(-1, versao - 1 - self.configuracao.itens_por_feed), -1)
+        )
+        corpo = ('<?xml version="1.0" encoding="UTF-8"?>'
+                 f'<rss version="2.0"><channel><title>Feed sintético {feed}</title>'
+                 f'<link>https://feeds.local/{feed}</link>{itens}</channel></rss>').encode('utf-8')
+        with self.trava:
+            self.corpos[feed] = (versao, corpo)
+        return corpo
+
+class FeedsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        servidor = self.server
+        configuracao = servidor.configuracao
+        servidor.contar('requisicoes')
+
+        atraso = configuracao.latencia_ms
+        if configuracao.variacao_latencia_ms:
+            atraso += random.expovariate(1 / configuracao.variacao_latencia_ms)
+        if atraso:
+            time.sleep(atraso / 1000)
+
+        partes = urlsplit(self.path).path.strip("/").split("/")
+        if len(partes) != 2 or partes[0] != "feed" or not partes[1].isdigit() \
+                or int(partes[1]) >= configuracao.n_feeds:
+            self.responder(404, b"Feed inexistente")
+            return
+        feed = int(partes[1])
+
+        if random.random() < configuracao.taxa_erros:
+            servidor.contar('erros_injetados')
+            self.responder(503, b"Erro injetado", {'Retry-After': '1'})
+            return
+
+        gerador = servidor.gerador
+        versao = gerador.versao(feed)
+        etag = f'"{feed}-{versao}"'
+        ultima_modificacao = formatdate(gerador.momento_da_versao(feed, versao), usegmt=True)
+        headers = {
+            'ETag': etag,
+            'Last-Modified': ultima_modificacao,
+            'Cache-Control': f"max-age={configuracao.max_age}",
+        }
+
+        if configuracao.suporte_304 and (
+            self.headers.get('If-None-Match') == etag
+            or (self.headers.get('If-None-Match') is None
+                and self.headers.get('If-Modified-Since') == ultima_modificacao)
+        ):
+            servidor.contar('respostas_304')
+            self.responder(304, b"", headers)
+            return
+
+        corpo = gerador.corpo(feed, versao)
+        if random.random() < configuracao.taxa_xml_invalido:
+            servidor.contar('xml_invalido')
+            corpo = corpo[:len(corpo) // 2]
+            # Sem validadores e sem cache: a falha é transitória, como um corte
+            # na transferência, e não pode voltar via 304 nos ciclos seguintes
+            headers = {'Cache-Control': 'no-store'}
+
+        servidor.contar('bytes_enviados', len(corpo))
+        headers['Content-Type'] = 'application/rss+xml; charset=utf-8'
+        self.responder(200, corpo, headers)
+
+    def responder(self, status, corpo, headers=None):
+        self.send_response(status)
+        for nome, valor in (headers or {}).items():
+            self.send_header(nome, valor)
+        self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        if corpo:
+            self.wfile.write(corpo)
+
+    def log_message(self, formato, *args):
+        if self.server.verboso:
+            super().log_message(formato, *args)
+
+class ServidorFeeds(ThreadingHTTPServer):
+    daemon_threads = True
+    # Muitos clientes simultâneos: a fila padrão (5) recusaria conexões
+    request_queue_size = 1024
+
+    def __init__(self, endereco, configuracao, verboso=False):
+        super().__init__(endereco, FeedsHandler)
+        self.configuracao = configuracao
+        self.gerador = GeradorFeeds(configuracao)
+        self.verboso = verboso
+        self.estatisticas = {'requisicoes': 0, 'respostas_304': 0, 'erros_injetados': 0,
+                             'xml_invalido': 0, 'bytes_enviados': 0}
+        self.trava_estatisticas = threading.Lock()
+
+    def contar(self, nome, quantidade=1):
+        with self.trava_estatisticas:
+            self.estatisticas[nome] += quantidade
+
+    def urls(self):
+        """URLs de todos os feeds servidos"""
+        base = f"http://127.0.0.1:{self.server_port}/feed/"
+        return [f"{base}{feed}" for feed in range(self.configuracao.n_feeds)]
+
+def criar_servidor(configuracao=None, host="127.0.0.1", porta=8001, verboso=False):
+    """Cria o servidor (use serve_forever() para iniciar; porta=0 escolhe uma livre)"""
+    return ServidorFeeds((host, porta), configuracao or ConfiguracaoFeeds(), verboso)
+
+def adicionar_argumentos(parser):
+    """Argumentos de configuração dos feeds (compartilhados com o teste de carga)"""
+    parser.add_argument("--feeds", type=int, default=100, help="Quantidade de feeds")
+    parser.add_argument("--itens", type=int, default=30, help="Itens por feed")
+    parser.add_argument("--tamanho-descricao", type=int, default=40, help="Palavras por descrição")
+    parser.add_argument("--novos-por-minuto", type=float, default=2.0,
+                        help="Notícias novas por feed por minuto")
+    parser.add_argument("--latencia-ms", type=float, default=0, help="Latência base")
+    parser.add_argument("--variacao-latencia-ms", type=float, default=0,
+                        help="Latência extra aleatória (média)")
+    parser.add_argument("--taxa-erros", type=float, default=0.0, help="Fração de respostas 503")
+    parser.add_argument("--taxa-xml-invalido", type=float, default=0.0,
+                        help="Fração de respostas com XML truncado")
+    parser.add_argument("--sem-304", action="store_true", help="Ignora requisições condicionais")
+    parser.add_argument("--max-age", type=int, default=0, help="Cache-Control max-age")
+
+def configuracao_dos_argumentos(args):
+    return ConfiguracaoFeeds(
+        n_feeds=args.feeds,
+        itens_por_feed=args.itens,
+        tamanho_descricao=args.tamanho_descricao,
+        novos_por_minuto=args.novos_por_minuto,
+        latencia_ms=args.latencia_ms,
+        variacao_latencia_ms=args.variacao_latencia_ms,
+        taxa_erros=args.taxa_erros,
+        taxa_xml_invalido=args.taxa_xml_invalido,
+        suporte_304=not args.sem_304,
+        max_age=args.max_age,
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local de feeds RSS sintéticos")
+    adicionar_argumentos(parser)
+    parser.add_argument("--porta", type=int, default=8001)
+    parser.add_argument("--verboso", action="store_true", help="Registra cada requisição")
+    args = parser.parse_args()
+
+    servidor = criar_servidor(configuracao_dos_argumentos(args), porta=args.porta, verboso=args.verboso)
+    print(f"{args.feeds} feeds em http://127.0.0.1:{servidor.server_port}/feed/0 ... /feed/{args.feeds - 1}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nServidor encerrado. Estatísticas: {servidor.estatisticas}")
+    finally:
+        servidor.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+TESTE DE CARGA DA API DE NOTÍCIAS
+Objetivo: Medir requisições por segundo e latência da api_noticias com
+conexões keep-alive em paralelo
+
+Uso:
+    python teste_carga_api.py                     # sobe a API com dados sintéticos
+    python teste_carga_api.py --url http://127.0.0.1:8000   # API já em execução
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+from api_noticias import criar_servidor
+
+CAMINHOS = [
+    "/noticias?limite=20",
+    f"/noticias?categoria={quote('Política')}&limite=20",
+    "/busca?q=governo",
+    "/categorias",
+]
+
+def gerar_fonte_sintetica(n_noticias=5000):
+    """Grava um JSON no formato de `salvar_json` e retorna o caminho"""
+    categorias = ["Política", "Economia", "Brasil", "Saúde", "Educação", "Esportes"]
+    palavras = ["governo", "chuva", "eleição", "vacina", "mercado", "escola", "polícia"]
+    noticias = [
+        {
+            'titulo': f"{random.choice(palavras)} {random.choice(palavras)} {i}",
+            'link': f"https://g1.globo.com/noticia/{i}",
+            'descricao': " ".join(random.choices(palavras, k=20)),
+            'categoria': random.choice(categorias),
+            'data_publicacao': f"Wed, 08 Aug 2025 {i % 24:02d}:{i % 60:02d}:00 -0300",
+            'data_formatada': "N/A",
+            'data_raspagem': "2025-08-08 12:00:00",
+            'guid': f"guid-{i}",
+        }
+        for i in range(n_noticias)
+    ]
+    descritor, caminho = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(descritor, 'w', encoding='utf-8') as arquivo:
+        json.dump(noticias, arquivo, ensure_ascii=False)
+    return caminho
+
+def cliente(host, porta, duracao, latencias, contadores, trava, usar_etag):
+    """Faz requisições em loop numa conexão keep-alive"""
+    conexao = http.client.HTTPConnection(host, porta, timeout=10)
+    etags = {}
+    fim = time.perf_counter() + duracao
+
+    while time.perf_counter() < fim:
+        caminho = random.choice(CAMINHOS)
+        headers = {'If-None-Match': etags[caminho]} if usar_etag and caminho in etags else {}
+
+        inicio = time.perf_counter()
+        try:
+            conexao.request("GET", caminho, headers=headers)
+            resposta = conexao.getresponse()
+            resposta.read()
+        except (OSError, http.client.HTTPException):
+            with trava:
+                contadores['erros'] += 1
+            conexao.close()
+            conexao = http.client.HTTPConnection(host, porta, timeout=10)
+            continue
+        latencias.append(time.perf_counter() - inicio)
+
+        with trava:
+            contadores[resposta.status] = contadores.get(resposta.status, 0) + 1
+        if resposta.getheader('ETag'):
+            etags[caminho] = resposta.getheader('ETag')
+
+    conexao.close()
+
+def percentil(valores_ordenados, p):
+    if not valores_ordenados:
+        return 0.0
+    return valores_ordenados[min(len(valores_ordenados) - 1, int(len(valores_ordenados) * p))]
+
+def executar_carga(host, porta, clientes=8, duracao=10, usar_etag=False):
+    """Dispara os clientes e imprime o resumo"""
+    latencias = []
+    contadores = {'erros': 0}
+    trava = threading.Lock()
+    threads = [
+        threading.Thread(target=cliente, args=(host, porta, duracao, latencias, contadores, trava, usar_etag))
+        for _ in range(clientes)
+    ]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    decorrido = time.perf_counter() - inicio
+
+    latencias.sort()
+    print(f"\nClientes: {clientes} | Duração: {decorrido:.1f}s | ETag: {'sim' if usar_etag else 'não'}")
+    print(f"Requisições: {len(latencias)} ({len(latencias) / decorrido:,.0f} req/s)")
+    print(f"Latência p50: {percentil(latencias, 0.50) * 1000:.2f} ms | "
+          f"p95: {percentil(latencias, 0.95) * 1000:.2f} ms | "
+          f"p99: {percentil(latencias, 0.99) * 1000:.2f} ms")
+    print(f"Respostas por status: {contadores}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga da API de notícias")
+    parser.add_argument("--url", help="API já em execução (padrão: sobe uma local)")
+    parser.add_argument("--fonte", help="JSON/SQLite para a API local (padrão: sintético)")
+    parser.add_argument("--clientes", type=int, default=8)
+    parser.add_argument("--duracao", type=float, default=10)
+    args = parser.parse_args()
+
+    servidor = None
+    fonte_temporaria = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, porta = url.hostname, url.port or 80
+    else:
+        fonte = args.fonte
+        if fonte is None:
+            fonte = fonte_temporaria = gerar_fonte_sintetica()
+        servidor = criar_servidor(fonte, porta=0)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        host, porta = "127.0.0.1", servidor.server_port
+        print(f"API local em http://{host}:{porta} (fonte: {fonte})")
+
+    try:
+        executar_carga(host, porta, args.clientes, args.duracao, usar_etag=False)
+        executar_carga(host, porta, args.clientes, args.duracao, usar_etag=True)
+    finally:
+        if servidor is not None:
+            servidor.shutdown()
+            servidor.server_close()
+        if fonte_temporaria is not None:
+            os.remove(fonte_temporaria)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+TESTE DE CARGA DO SCRAPER
+Objetivo: Medir vazão, latência de cauda e memória do G1RSScraper e do ciclo
+do monitorar_noticias com centenas de feeds, usando o servidor sintético
+
+Cada ciclo raspa todos os feeds em paralelo (fazer_requisicao + parsear_rss)
+e, como no monitoramento, filtra as notícias inalteradas (opcional) e
+ingere tudo no AgregadorIncremental. Ao final de cada ciclo são impressos:
+feeds/s, notícias/s, latência p50/p95/p99/máx, erros e RSS do processo.
+
+Uso:
+    python teste_carga_scraper.py --feeds 300 --concorrencia 1 8 32
+    python teste_carga_scraper.py --feeds 200 --latencia-ms 100 --taxa-erros 0.05 --cache --revisoes
+    python teste_carga_scraper.py --url http://127.0.0.1:8001 --feeds 100   # servidor já em execução
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+from agregados_incrementais import AgregadorIncremental
+from bs4_g1rss_monitoramento import G1RSScraper
+from perfilamento import obter_rss_mb
+from revisoes import RegistroRevisoes
+from servidor_feeds_sintetico import adicionar_argumentos, configuracao_dos_argumentos, criar_servidor
+
+def percentil(valores_ordenados, p):
+    if not valores_ordenados:
+        return 0.0
+    return valores_ordenados[min(len(valores_ordenados) - 1, int(len(valores_ordenados) * p))]
+
+def raspar_feed(url, cache):
+    """
+    Raspa um feed como o executar_raspagem, sem salvar arquivos
+
+    Returns:
+        tuple: (scraper, resultado, segundos na rede, segundos no total)
+    """
+    scraper = G1RSScraper(cache=cache)
+    scraper.url = url
+
+    inicio = time.perf_counter()
+    xml_content = scraper.fazer_requisicao()
+    tempo_rede = time.perf_counter() - inicio
+    if not xml_content:
+        return scraper, 'erro_rede', tempo_rede, tempo_rede
+
+    resultado = 'ok' if scraper.parsear_rss(xml_content) else 'xml_invalido'
+    return scraper, resultado, tempo_rede, time.perf_counter() - inicio
+
+def executar_ciclo(urls, concorrencia, cache, revisoes, agregador):
+    """Executa um ciclo de monitoramento sobre todos os feeds e retorna as métricas"""
+    contagem = {'ok': 0, 'erro_rede': 0, 'xml_invalido': 0}
+    latencias = []
+    noticias = 0
+    novas = 0
+
+    inicio = time.perf_counter()
+    # Os prints do scraper (um por feed) poluiriam o relatório
+    with open(os.devnull, 'w') as nulo, redirect_stdout(nulo):
+        with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+            resultados = executor.map(lambda url: raspar_feed(url, cache), urls)
+            for scraper, resultado, tempo_rede, tempo_total in resultados:
+                contagem[resultado] += 1
+                latencias.append(tempo_total)
+                if resultado != 'ok':
+                    continue
+
+                # Etapas do monitoramento que rodam na thread principal
+                noticias_ciclo = scraper.noticias
+                if revisoes is not None:
+                    scraper.revisoes = revisoes
+                    scraper.separar_alteradas()
+                    noticias_ciclo = scraper.alteradas
+                noticias += len(noticias_ciclo)
+                novas += agregador.ingerir(noticias_ciclo)
+        agregador.salvar()
+    decorrido = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        'decorrido': decorrido,
+        'contagem': contagem,
+        'latencias': latencias,
+        'noticias': noticias,
+        'novas': novas,
+    }
+
+def exibir_ciclo(numero, metricas, rss_inicial):
+    decorrido = metricas['decorrido']
+    latencias = metricas['latencias']
+    contagem = metricas['contagem']
+    rss = obter_rss_mb()
+    linha = (f"{numero:>5} {decorrido:>8.2f} {len(latencias) / decorrido:>8.1f} "
+             f"{metricas['noticias'] / decorrido:>10,.0f} {metricas['novas']:>7} "
+             f"{percentil(latencias, 0.50) * 1000:>8.1f} {percentil(latencias, 0.95) * 1000:>8.1f} "
+             f"{percentil(latencias, 0.99) * 1000:>8.1f} {(latencias[-1] if latencias else 0) * 1000:>8.1f} "
+             f"{contagem['erro_rede']:>6} {contagem['xml_invalido']:>6} "
+             f"{rss:>8.1f} {rss - rss_inicial:>+8.1f}")
+    if tracemalloc.is_tracing():
+        _, pico = tracemalloc.get_traced_memory()
+        linha += f" {pico / 1024 ** 2:>9.1f}"
+        tracemalloc.reset_peak()
+    print(linha)
+
+def executar_carga(urls, concorrencia, ciclos, intervalo, diretorio, usar_cache, usar_revisoes):
+    """Roda `ciclos` ciclos de monitoramento com a concorrência dada"""
+    cache = None
+    if usar_cache:
+        from cache_http import CacheHTTP
+        cache = CacheHTTP(diretorio=os.path.join(diretorio, f"cache_{concorrencia}"), max_age_padrao=0)
+    revisoes = RegistroRevisoes(os.path.join(diretorio, f"revisoes_{concorrencia}.db")) if usar_revisoes else None
+    agregador = AgregadorIncremental(os.path.join(diretorio, f"agregados_{concorrencia}.json"))
+
+    print(f"\nConcorrência: {concorrencia} | Feeds: {len(urls)} | Cache: {'sim' if cache else 'não'} | "
+          f"Revisões: {'sim' if revisoes else 'não'}")
+    cabecalho = (f"{'Ciclo':>5} {'Tempo(s)':>8} {'Feeds/s':>8} {'Notícias/s':>10} {'Novas':>7} "
+                 f"{'p50(ms)':>8} {'p95(ms)':>8} {'p99(ms)':>8} {'máx(ms)':>8} "
+                 f"{'ErrRed':>6} {'ErrXML':>6} {'RSS(MB)':>8} {'ΔRSS':>8}")
+    if tracemalloc.is_tracing():
+        cabecalho += f" {'Pico(MB)':>9}"
+    print(cabecalho)
+    print("-" * len(cabecalho))
+
+    rss_inicial = obter_rss_mb()
+    for numero in range(1, ciclos + 1):
+        metricas = executar_ciclo(urls, concorrencia, cache, revisoes, agregador)
+        exibir_ciclo(numero, metricas, rss_inicial)
+        if numero < ciclos and intervalo:
+            time.sleep(intervalo)
+
+    if cache is not None:
+        print(f"Cache HTTP: {cache.acertos} acertos, {cache.falhas} idas à rede")
+    if revisoes is not None:
+        revisoes.fechar()
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga do scraper contra feeds sintéticos")
+    adicionar_argumentos(parser)
+    parser.add_argument("--url", help="Servidor de feeds já em execução (padrão: sobe um local)")
+    parser.add_argument("--concorrencia", type=int, nargs="+", default=[8],
+                        help="Threads de raspagem (vários valores = varredura)")
+    parser.add_argument("--ciclos", type=int, default=3, help="Ciclos de monitoramento por concorrência")
+    parser.add_argument("--intervalo", type=float, default=0, help="Segundos entre ciclos")
+    parser.add_argument("--cache", action="store_true", help="Usa CacheHTTP (revalidação com 304)")
+    parser.add_argument("--revisoes", action="store_true", help="Filtra inalteradas com RegistroRevisoes")
+    parser.add_argument("--tracemalloc", action="store_true", help="Mede o pico de memória Python por ciclo")
+    args = parser.parse_args()
+
+    servidor = None
+    if args.url:
+        urls = [f"{args.url.rstrip('/')}/feed/{feed}" for feed in range(args.feeds)]
+    else:
+        servidor = criar_servidor(configuracao_dos_argumentos(args), porta=0)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        urls = servidor.urls()
+        print(f"Servidor sintético em http://127.0.0.1:{servidor.server_port}/feed/ ({args.feeds} feeds)")
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    diretorio = tempfile.mkdtemp(prefix="carga_scraper_")
+    try:
+        for concorrencia in args.concorrencia:
+            executar_carga(urls, concorrencia, args.ciclos, args.intervalo, diretorio,
+                           args.cache, args.revisoes)
+    except KeyboardInterrupt:
+        print("\nTeste interrompido.")
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+        if servidor is not None:
+            servidor.shutdown()
+            servidor.server_close()
+            print(f"\nServidor: {servidor.estatisticas}")
+
+if __name__ == "__main__":
+    main()